@@ -1,16 +1,36 @@
 """ShipVox application module."""
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
-from app.config import Config
+from fastapi.responses import ORJSONResponse
+from app.config import Config, get_config
+
+# Set SHIPVOX_DOCS=false to skip OpenAPI schema generation and the docs routes
+docs_enabled = os.getenv("SHIPVOX_DOCS", "true").lower() == "true"
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Initialize carrier clients before serving and release them on shutdown."""
+    await main.startup()
+    try:
+        yield
+    finally:
+        await main.shutdown()
 
 # Create FastAPI app instance
 app = FastAPI(
     title="ShipVox API",
     description="Unified shipping API for FedEx and UPS",
-    version="1.0.0"
+    version="1.0.0",
+    openapi_url="/openapi.json" if docs_enabled else None,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
-# Import views to register routes
+# Import views to register routes; lifespan reaches startup/shutdown through it
 from app import main
 
 # Export public interface
-__all__ = ['app', 'Config']
+__all__ = ['app', 'Config', 'get_config']
@@ -1,14 +1,42 @@
 # Config
 # TODO: Implement this module
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional, Tuple
 import os
-import json
+
+import orjson
+
+# (dot-notation path, environment variable) pairs that must be set
+_REQUIRED_SETTINGS = (
+    ("environment", "SHIPVOX_ENVIRONMENT"),
+    ("fedex.client_id", "FEDEX_CLIENT_ID"),
+    ("fedex.client_secret", "FEDEX_CLIENT_SECRET"),
+    ("fedex.account_number", "FEDEX_ACCOUNT_NUMBER"),
+    ("ups.client_id", "UPS_CLIENT_ID"),
+    ("ups.client_secret", "UPS_CLIENT_SECRET"),
+    ("ups.account_number", "UPS_ACCOUNT_NUMBER")
+)
+
+def _flatten(data: Dict[str, Any], prefix: str = "") -> Iterator[Tuple[str, Any]]:
+    """
+    Yield (dot-notation path, value) pairs for every node of a nested dict.
+    
+    Intermediate dicts are yielded as well, so 'fedex' maps to the whole
+    FedEx section and 'fedex.client_id' to the leaf value.
+    """
+    for key, value in data.items():
+        path = f"{prefix}{key}"
+        yield path, value
+        if isinstance(value, dict):
+            yield from _flatten(value, f"{path}.")
 
 class Config:
     """Application configuration manager."""
     
+    __slots__ = ('_config', '_flat')
+    
     def __init__(self, config_file: Optional[str] = None):
         """
         Initialize configuration.
@@ -17,6 +45,7 @@ class Config:
             config_file (Optional[str]): Path to config file. If None, uses environment variables.
         """
         self._config: Dict[str, Any] = {}
+        self._flat: Dict[str, Any] = {}
         self._load_config(config_file)
     
     def _load_config(self, config_file: Optional[str]) -> None:
@@ -26,52 +55,45 @@ class Config:
         else:
             self._load_from_env()
             
+        # Index every dot-notation path once so lookups are a single hash probe
+        self._flat = dict(_flatten(self._config))
+            
         # Validate required settings
         self._validate_config()
     
     def _load_from_file(self, config_file: str) -> None:
         """Load configuration from JSON file."""
         try:
-            with open(config_file, 'r') as f:
-                self._config = json.load(f)
-        except Exception as e:
+            self._config = orjson.loads(Path(config_file).read_bytes())
+        except (OSError, orjson.JSONDecodeError) as e:
             raise ValueError(f"Failed to load config file: {str(e)}")
     
     def _load_from_env(self) -> None:
         """Load configuration from environment variables."""
+        env = os.environ
         self._config = {
-            "environment": os.getenv("SHIPVOX_ENVIRONMENT", "sandbox"),
-            "log_level": os.getenv("SHIPVOX_LOG_LEVEL", "INFO"),
-            "log_file": os.getenv("SHIPVOX_LOG_FILE"),
+            "environment": env.get("SHIPVOX_ENVIRONMENT", "sandbox"),
+            "log_level": env.get("SHIPVOX_LOG_LEVEL", "INFO"),
+            "log_file": env.get("SHIPVOX_LOG_FILE"),
             "fedex": {
-                "client_id": os.getenv("FEDEX_CLIENT_ID"),
-                "client_secret": os.getenv("FEDEX_CLIENT_SECRET"),
-                "account_number": os.getenv("FEDEX_ACCOUNT_NUMBER")
+                "client_id": env.get("FEDEX_CLIENT_ID"),
+                "client_secret": env.get("FEDEX_CLIENT_SECRET"),
+                "account_number": env.get("FEDEX_ACCOUNT_NUMBER")
             },
             "ups": {
-                "client_id": os.getenv("UPS_CLIENT_ID"),
-                "client_secret": os.getenv("UPS_CLIENT_SECRET"),
-                "account_number": os.getenv("UPS_ACCOUNT_NUMBER")
+                "client_id": env.get("UPS_CLIENT_ID"),
+                "client_secret": env.get("UPS_CLIENT_SECRET"),
+                "account_number": env.get("UPS_ACCOUNT_NUMBER")
             }
         }
     
     def _validate_config(self) -> None:
         """Validate required configuration settings."""
-        required_settings = [
-            ("environment", "SHIPVOX_ENVIRONMENT"),
-            ("fedex.client_id", "FEDEX_CLIENT_ID"),
-            ("fedex.client_secret", "FEDEX_CLIENT_SECRET"),
-            ("fedex.account_number", "FEDEX_ACCOUNT_NUMBER"),
-            ("ups.client_id", "UPS_CLIENT_ID"),
-            ("ups.client_secret", "UPS_CLIENT_SECRET"),
-            ("ups.account_number", "UPS_ACCOUNT_NUMBER")
+        missing = [
+            f"{path} ({env_var})"
+            for path, env_var in _REQUIRED_SETTINGS
+            if not self._flat.get(path)
         ]
-        
-        missing = []
-        for path, env_var in required_settings:
-            value = self.get(path)
-            if not value:
-                missing.append(f"{path} ({env_var})")
                 
         if missing:
             raise ValueError(f"Missing required configuration: {', '.join(missing)}")
@@ -87,16 +109,7 @@ class Config:
         Returns:
             Any: Configuration value
         """
-        parts = path.split('.')
-        value = self._config
-        
-        for part in parts:
-            if isinstance(value, dict) and part in value:
-                value = value[part]
-            else:
-                return default
-                
-        return value
+        return self._flat.get(path, default)
     
     @property
     def environment(self) -> str:
@@ -122,3 +135,16 @@ class Config:
     def ups_config(self) -> Dict[str, str]:
         """Get UPS configuration."""
         return self.get("ups", {})
+
+@lru_cache(maxsize=None)
+def get_config(config_file: Optional[str] = None) -> Config:
+    """
+    Get the shared configuration instance for a config source.
+    
+    Args:
+        config_file (Optional[str]): Path to config file. If None, uses environment variables.
+        
+    Returns:
+        Config: The configuration instance
+    """
+    return Config(config_file)
@@ -1,16 +1,16 @@
 """Main application routes and handlers."""
 from fastapi import HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
 from pydantic import BaseModel, Field
-import os
+from datetime import datetime
+from pathlib import Path
+import asyncio
 
 from app import app
-from app.config import Config
-from auth import auth_manager
-from rates import RateComparer, ServiceNormalizer
-from labels import get_label_manager, Address, Package, LabelRequest
+from app.config import get_config
 from utils.log import logger
 from utils.validators import ShippingValidator
 from utils.exceptions import (
@@ -18,19 +18,26 @@ from utils.exceptions import (
     RateError, LabelError, ServiceMappingError
 )
 
+if TYPE_CHECKING:
+    from rates import RateComparer, ServiceNormalizer
+    from rates.rate_comparer import RateOption as ComparedRateOption
+    from labels import LabelManager
+    from auth.refresher import TokenRefresher
+
 # Initialize configuration
-config = Config()
+config = get_config()
 
 # Set up logging
 logger.setLevel(config.log_level)
 if config.log_file:
     logger.add_file_handler(config.log_file)
 
-# Initialize auth manager
-auth_manager.initialize_with_config(config.fedex_config, config.ups_config)
-
-# Initialize service normalizer
-service_normalizer = ServiceNormalizer()
+# Carrier modules are imported lazily so that importing this module stays
+# cheap.
+service_normalizer: Optional["ServiceNormalizer"] = None
+rate_comparer: Optional["RateComparer"] = None
+label_manager: Optional["LabelManager"] = None
+token_refresher: Optional["TokenRefresher"] = None
 
 # Add CORS middleware
 app.add_middleware(
@@ -41,9 +48,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Mount static files for label PDFs
-os.makedirs("static/labels", exist_ok=True)
-app.mount("/static", StaticFiles(directory="static"), name="static")
+# Mount static files for label PDFs; the directory is created at startup,
+# so skip Starlette's import-time existence check
+LABELS_DIR = Path("static/labels")
+app.mount(
+    "/static",
+    StaticFiles(directory="static", check_dir=False, html=False),
+    name="static"
+)
 
 # Request/Response Models
 class AddressModel(BaseModel):
@@ -65,10 +77,15 @@ class DimensionsModel(BaseModel):
     width: float = Field(..., gt=0)
     height: float = Field(..., gt=0)
 
+# Same format as ShippingValidator.ZIP_CODE_PATTERN. With it, RateRequest's
+# field constraints cover validate_rate_request and are checked in pydantic-core,
+# whose Rust regex treats $ as end of text (it has no \Z)
+ZIP_CODE_PATTERN = r'^[0-9]{5}(-[0-9]{4})?$'
+
 class RateRequest(BaseModel):
     """Rate request model."""
-    origin_zip: str
-    destination_zip: str
+    origin_zip: str = Field(..., pattern=ZIP_CODE_PATTERN)
+    destination_zip: str = Field(..., pattern=ZIP_CODE_PATTERN)
     weight: float = Field(..., gt=0)
     dimensions: DimensionsModel
     pickup_requested: bool = False
@@ -108,7 +125,58 @@ class LabelResponse(BaseModel):
     cost: float
     carrier: str
     service: str
-    estimated_delivery: Optional[str] = None
+    estimated_delivery: Optional[datetime] = None
+
+async def startup() -> None:
+    """Initialize carrier authentication and service mappings; run by the app lifespan."""
+    global service_normalizer, rate_comparer, label_manager, token_refresher
+    from auth import auth_manager
+    from auth.refresher import TokenRefresher
+    from rates import RateComparer, FedExRates, UPSRates, get_normalizer
+    from labels import get_label_manager
+    
+    LABELS_DIR.mkdir(parents=True, exist_ok=True)
+    auth_manager.initialize_with_config(config.fedex_config, config.ups_config)
+    service_normalizer = get_normalizer()
+    fedex_auth, ups_auth = auth_manager.fedex_auth, auth_manager.ups_auth
+    rate_comparer = RateComparer(
+        service_normalizer,
+        fedex_rates=FedExRates(fedex_auth, fedex_auth.environment) if fedex_auth else None,
+        ups_rates=UPSRates(ups_auth, ups_auth.environment) if ups_auth else None
+    )
+    label_manager = get_label_manager(auth_manager)
+    
+    # Keep carrier tokens fresh off the request path
+    token_refresher = TokenRefresher(auth_manager)
+    token_refresher.start()
+
+def _to_rate_option(option: Optional["ComparedRateOption"]) -> Optional[RateOption]:
+    """
+    Convert a comparer rate option into the response model without validation.
+    
+    Args:
+        option (Optional[ComparedRateOption]): The rate option from RateComparer
+        
+    Returns:
+        Optional[RateOption]: The response model, or None if no option was given
+    """
+    if option is None:
+        return None
+    return RateOption.model_construct(
+        carrier=option.carrier,
+        service=option.service_name,
+        normalized_service=option.normalized_service,
+        cost=option.cost,
+        estimated_days=option.estimated_days
+    )
+
+async def shutdown() -> None:
+    """Stop background token refresh and close the shared carrier HTTP session; run by the app lifespan."""
+    from utils.http import close_session
+    
+    if token_refresher is not None:
+        await token_refresher.stop()
+    await close_session()
 
 @app.get("/health")
 async def health_check() -> Dict[str, str]:
@@ -116,51 +184,19 @@ async def health_check() -> Dict[str, str]:
     return {"status": "healthy"}
 
 @app.post("/rates", response_model=RateResponse)
-async def get_rates(request: RateRequest) -> RateResponse:
+async def get_rates(request: RateRequest) -> ORJSONResponse:
     """Get shipping rates from all carriers."""
     try:
-        # Validate request
-        ShippingValidator.validate_rate_request({
-            "origin_zip": request.origin_zip,
-            "destination_zip": request.destination_zip,
-            "weight": request.weight,
-            "dimensions": request.dimensions.dict()
-        })
-        
-        # Create rate comparer
-        rate_comparer = RateComparer(service_normalizer)
-        
-        # Get FedEx rates
-        try:
-            fedex_auth = await auth_manager.get_fedex_auth()
-            fedex_rates = await fedex_auth.get_rates(
-                request.origin_zip,
-                request.destination_zip,
-                request.weight,
-                request.dimensions.dict()
-            )
-            for rate in fedex_rates:
-                rate_comparer.add_rate_option("FedEx", rate)
-        except Exception as e:
-            logger.error(f"Failed to get FedEx rates: {str(e)}")
-        
-        # Get UPS rates
-        try:
-            ups_auth = await auth_manager.get_ups_auth()
-            ups_rates = await ups_auth.get_rates(
-                request.origin_zip,
-                request.destination_zip,
-                request.weight,
-                request.dimensions.dict()
-            )
-            for rate in ups_rates:
-                rate_comparer.add_rate_option("UPS", rate)
-        except Exception as e:
-            logger.error(f"Failed to get UPS rates: {str(e)}")
-        
-        # Get best options
-        cheapest, fastest = rate_comparer.get_best_options()
-        all_options = rate_comparer.get_all_options()
+        # Fetch FedEx and UPS rates concurrently; a failing carrier is logged and skipped
+        dimensions = request.dimensions
+        cheapest, fastest, all_options = await rate_comparer.fetch_and_compare(
+            request.origin_zip,
+            request.destination_zip,
+            request.weight,
+            dimensions.length,
+            dimensions.width,
+            dimensions.height
+        )
         
         if not all_options:
             raise APIError(
@@ -169,12 +205,17 @@ async def get_rates(request: RateRequest) -> RateResponse:
                 message="No rates available from any carrier"
             )
         
-        return RateResponse(
-            cheapest_option=cheapest,
-            cheapest_fastest_option=fastest,
-            all_options=all_options
+        # Options were built internally, so skip re-validating them
+        response = RateResponse.model_construct(
+            cheapest_option=_to_rate_option(cheapest),
+            cheapest_fastest_option=_to_rate_option(fastest),
+            all_options=[_to_rate_option(option) for option in all_options]
         )
         
+        # Returning a Response bypasses FastAPI's response_model validation pass;
+        # response_model is kept for the OpenAPI schema
+        return ORJSONResponse(response.model_dump(mode="json"))
+        
     except ValidationError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except AuthenticationError as e:
@@ -188,15 +229,18 @@ async def get_rates(request: RateRequest) -> RateResponse:
 @app.post("/labels", response_model=LabelResponse)
 async def create_label(request: LabelGenerationRequest) -> LabelResponse:
     """Create a shipping label."""
+    from labels import Address, Package, LabelRequest
+    
     try:
         # Validate addresses
-        ShippingValidator.validate_address(request.from_address.dict())
-        ShippingValidator.validate_address(request.to_address.dict())
+        ShippingValidator.validate_address(request.from_address)
+        ShippingValidator.validate_address(request.to_address)
         
-        # Create label request
+        # Create label request; AddressModel mirrors the Address fields, so its
+        # attribute dict is unpacked directly instead of copying via .dict()
         label_request = LabelRequest(
-            from_address=Address(**request.from_address.dict()),
-            to_address=Address(**request.to_address.dict()),
+            from_address=Address(**vars(request.from_address)),
+            to_address=Address(**vars(request.to_address)),
             package=Package(
                 weight=request.weight,
                 length=request.dimensions.length,
@@ -211,14 +255,15 @@ async def create_label(request: LabelGenerationRequest) -> LabelResponse:
             reference=request.reference
         )
         
-        # Get label manager and create label
-        label_manager = get_label_manager(auth_manager)
-        response = await label_manager.create_label(request.carrier.lower(), label_request)
+        # Create label
+        carrier = request.carrier.lower()
+        response = await label_manager.create_label(carrier, label_request)
+        label_data = await label_manager.fetch_label_bytes(carrier, response)
         
         # Save label PDF and return URL
-        label_path = f"static/labels/{response.tracking_number}.pdf"
-        with open(label_path, "wb") as f:
-            f.write(response.label_data)
+        # Write in a worker thread so the event loop keeps serving other requests
+        label_path = LABELS_DIR / f"{response.tracking_number}.pdf"
+        await asyncio.to_thread(label_path.write_bytes, label_data)
         
         return LabelResponse(
             tracking_number=response.tracking_number,
@@ -226,7 +271,7 @@ async def create_label(request: LabelGenerationRequest) -> LabelResponse:
             cost=response.cost,
             carrier=response.carrier,
             service=response.service,
-            estimated_delivery=response.estimated_delivery.isoformat() if response.estimated_delivery else None
+            estimated_delivery=response.estimated_delivery
         )
         
     except ValidationError as e:
@@ -243,7 +288,6 @@ async def create_label(request: LabelGenerationRequest) -> LabelResponse:
 async def void_label(tracking_number: str, carrier: str) -> Dict[str, bool]:
     """Void a shipping label."""
     try:
-        label_manager = get_label_manager(auth_manager)
         success = await label_manager.void_label(carrier.lower(), tracking_number)
         return {"success": success}
         
@@ -261,7 +305,6 @@ async def void_label(tracking_number: str, carrier: str) -> Dict[str, bool]:
 async def get_label_status(tracking_number: str, carrier: str) -> Dict[str, Any]:
     """Get shipping label status."""
     try:
-        label_manager = get_label_manager(auth_manager)
         status = await label_manager.get_label_status(carrier.lower(), tracking_number)
         return status
         
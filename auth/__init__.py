@@ -1,17 +1,26 @@
 """Authentication module initialization."""
-from typing import Dict, Optional
+from typing import Dict, Optional, Type, TypeVar
 from pathlib import Path
-import json
 import os
 
+import orjson
+
+from auth.base_auth import BaseCarrierAuth
 from auth.fedex_auth import FedExAuth
 from auth.ups_auth import UPSAuth
 from utils.exceptions import ConfigurationError
 from utils.log import logger
 
+AuthT = TypeVar("AuthT", bound=BaseCarrierAuth)
+
+# Shared default for missing carrier sections; never mutated
+_EMPTY_CONFIG: Dict = {}
+
 class AuthManager:
     """Manages carrier authentication instances."""
     
+    __slots__ = ('fedex_auth', 'ups_auth', '_config')
+    
     def __init__(self):
         """Initialize the auth manager."""
         self.fedex_auth: Optional[FedExAuth] = None
@@ -49,51 +58,57 @@ class AuthManager:
     def _load_config_file(self, config_file: str) -> None:
         """Load configuration from a JSON file."""
         try:
-            with open(config_file, 'r') as f:
-                self._config = json.load(f)
-        except Exception as e:
+            self._config = orjson.loads(Path(config_file).read_bytes())
+        except (OSError, orjson.JSONDecodeError) as e:
             raise ConfigurationError(f"Failed to load config file: {str(e)}")
             
     def _load_config_env(self) -> None:
         """Load configuration from environment variables."""
+        env = os.environ
         self._config = {
             "fedex": {
-                "client_id": os.getenv("FEDEX_CLIENT_ID"),
-                "client_secret": os.getenv("FEDEX_CLIENT_SECRET"),
-                "environment": os.getenv("FEDEX_ENVIRONMENT", "sandbox")
+                "client_id": env.get("FEDEX_CLIENT_ID"),
+                "client_secret": env.get("FEDEX_CLIENT_SECRET"),
+                "environment": env.get("FEDEX_ENVIRONMENT", "sandbox")
             },
             "ups": {
-                "client_id": os.getenv("UPS_CLIENT_ID"),
-                "client_secret": os.getenv("UPS_CLIENT_SECRET"),
-                "environment": os.getenv("UPS_ENVIRONMENT", "sandbox")
+                "client_id": env.get("UPS_CLIENT_ID"),
+                "client_secret": env.get("UPS_CLIENT_SECRET"),
+                "environment": env.get("UPS_ENVIRONMENT", "sandbox")
             }
         }
         
     def _initialize_auth(self) -> None:
         """Initialize authentication instances."""
-        # Initialize FedEx auth if credentials are available
-        fedex_config = self._config.get("fedex", {})
-        if fedex_config.get("client_id") and fedex_config.get("client_secret"):
-            self.fedex_auth = FedExAuth(
-                client_id=fedex_config["client_id"],
-                client_secret=fedex_config["client_secret"],
-                environment=fedex_config.get("environment", "sandbox")
-            )
-            logger.info("FedEx authentication initialized")
-        else:
-            logger.warning("FedEx credentials not found")
+        self.fedex_auth = self._create_auth("FedEx", FedExAuth)
+        self.ups_auth = self._create_auth("UPS", UPSAuth)
+        
+    def _create_auth(self, carrier: str, auth_class: Type[AuthT]) -> Optional[AuthT]:
+        """
+        Create a carrier auth instance if its credentials are available.
+        
+        Args:
+            carrier (str): The carrier name ('FedEx' or 'UPS')
+            auth_class (Type[AuthT]): The carrier auth implementation
             
-        # Initialize UPS auth if credentials are available
-        ups_config = self._config.get("ups", {})
-        if ups_config.get("client_id") and ups_config.get("client_secret"):
-            self.ups_auth = UPSAuth(
-                client_id=ups_config["client_id"],
-                client_secret=ups_config["client_secret"],
-                environment=ups_config.get("environment", "sandbox")
-            )
-            logger.info("UPS authentication initialized")
-        else:
-            logger.warning("UPS credentials not found")
+        Returns:
+            Optional[AuthT]: The auth instance, or None if credentials are missing
+        """
+        carrier_config = self._config.get(carrier.lower(), _EMPTY_CONFIG)
+        client_id = carrier_config.get("client_id")
+        client_secret = carrier_config.get("client_secret")
+        
+        if not (client_id and client_secret):
+            logger.warning("%s credentials not found", carrier)
+            return None
+            
+        auth = auth_class(
+            client_id=client_id,
+            client_secret=client_secret,
+            environment=carrier_config.get("environment", "sandbox")
+        )
+        logger.info("%s authentication initialized", carrier)
+        return auth
             
     async def get_fedex_auth(self) -> FedExAuth:
         """
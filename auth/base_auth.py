@@ -2,12 +2,72 @@
 # TODO: Implement this module
 
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
-from datetime import datetime, timedelta
+from typing import ClassVar, Dict, Optional, Tuple
+import asyncio
+import time
+
+# Tokens are treated as expired this many seconds before the carrier's expiry
+TOKEN_EXPIRY_BUFFER_SECONDS = 300
+
+# Tokens shared by every auth instance in the process, keyed by (carrier, client_id),
+# with the time.monotonic() deadline after which they must be refreshed
+_TOKEN_CACHE: Dict[Tuple[str, str], Tuple[Dict, float]] = {}
+_TOKEN_LOCKS: Dict[Tuple[str, str], asyncio.Lock] = {}
+
+def _cache_get(key: Tuple[str, str]) -> Optional[Tuple[Dict, float]]:
+    """
+    Get a cached token that is still valid.
+    
+    Args:
+        key (Tuple[str, str]): The (carrier, client_id) cache key
+        
+    Returns:
+        Optional[Tuple[Dict, float]]: The token response and its deadline, if still valid
+    """
+    entry = _TOKEN_CACHE.get(key)
+    if entry is None or time.monotonic() >= entry[1]:
+        return None
+    return entry
+
+def _get_token_lock(key: Tuple[str, str]) -> asyncio.Lock:
+    """
+    Get the lock that serializes token refreshes for a cache key.
+    
+    Args:
+        key (Tuple[str, str]): The (carrier, client_id) cache key
+        
+    Returns:
+        asyncio.Lock: The refresh lock
+    """
+    lock = _TOKEN_LOCKS.get(key)
+    if lock is None:
+        lock = _TOKEN_LOCKS[key] = asyncio.Lock()
+    return lock
+
+def _cache_put(key: Tuple[str, str], token_response: Dict) -> Tuple[Dict, float]:
+    """
+    Cache a token response.
+    
+    Args:
+        key (Tuple[str, str]): The (carrier, client_id) cache key
+        token_response (Dict): The token response from the carrier
+        
+    Returns:
+        Tuple[Dict, float]: The token response and its deadline
+    """
+    expires_in = float(token_response.get('expires_in', 3600))
+    entry = (token_response, time.monotonic() + expires_in - TOKEN_EXPIRY_BUFFER_SECONDS)
+    _TOKEN_CACHE[key] = entry
+    return entry
 
 class BaseCarrierAuth(ABC):
     """Abstract base class for carrier authentication implementations."""
     
+    __slots__ = ('client_id', 'client_secret', 'environment', '_token', '_token_expiry_mono')
+    
+    # Carrier name used to key the shared token cache
+    carrier: ClassVar[str]
+    
     def __init__(self, client_id: str, client_secret: str, environment: str = "production"):
         """
         Initialize the carrier authentication handler.
@@ -21,7 +81,8 @@ class BaseCarrierAuth(ABC):
         self.client_secret = client_secret
         self.environment = environment
         self._token: Optional[Dict] = None
-        self._token_expiry: Optional[datetime] = None
+        # time.monotonic() deadline after which the token must be refreshed
+        self._token_expiry_mono: float = 0.0
     
     @abstractmethod
     async def get_access_token(self) -> str:
@@ -51,9 +112,7 @@ class BaseCarrierAuth(ABC):
         Returns:
             bool: True if the token is valid, False otherwise
         """
-        if not self._token or not self._token_expiry:
-            return False
-        return datetime.now() < self._token_expiry - timedelta(minutes=5)
+        return self._token is not None and time.monotonic() < self._token_expiry_mono
     
     def _update_token(self, token_response: Dict) -> None:
         """
@@ -62,9 +121,57 @@ class BaseCarrierAuth(ABC):
         Args:
             token_response (Dict): The token response from the carrier
         """
-        self._token = token_response
-        expires_in = token_response.get('expires_in', 3600)
-        self._token_expiry = datetime.now() + timedelta(seconds=expires_in)
+        self._token, self._token_expiry_mono = _cache_put(
+            (self.carrier, self.client_id), token_response
+        )
+    
+    async def _ensure_token(self) -> Dict:
+        """
+        Get a valid token response, refreshing it if needed.
+        
+        Tokens are shared through the process-wide cache, so new instances
+        with the same credentials reuse an existing token. Concurrent
+        refreshes for the same credentials wait on one lock and result in
+        a single request to the carrier.
+        
+        Returns:
+            Dict: The token response
+        """
+        if self._is_token_valid():
+            return self._token
+            
+        key = (self.carrier, self.client_id)
+        async with _get_token_lock(key):
+            entry = _cache_get(key)
+            if entry is None:
+                token_response = await self._fetch_new_token()
+                entry = _cache_put(key, token_response)
+            self._token, self._token_expiry_mono = entry
+            
+        return self._token
+    
+    async def refresh_token(self) -> Dict:
+        """
+        Fetch a new token regardless of the current one's expiry.
+        
+        Returns:
+            Dict: The new token response
+        """
+        key = (self.carrier, self.client_id)
+        async with _get_token_lock(key):
+            token_response = await self._fetch_new_token()
+            self._token, self._token_expiry_mono = _cache_put(key, token_response)
+            
+        return self._token
+    
+    def seconds_until_refresh(self) -> float:
+        """
+        Get the time left before the current token must be refreshed.
+        
+        Returns:
+            float: Seconds until refresh; zero or negative if already due
+        """
+        return self._token_expiry_mono - time.monotonic()
     
     @abstractmethod
     def get_auth_headers(self) -> Dict[str, str]:
@@ -75,3 +182,16 @@ class BaseCarrierAuth(ABC):
             Dict[str, str]: The headers dictionary
         """
         pass
+    
+    async def get_valid_auth_headers(self) -> Dict[str, str]:
+        """
+        Get the authentication headers, fetching a token first if needed.
+        
+        A valid token costs one monotonic clock read, and carriers reuse
+        their header dict until the token rotates.
+        
+        Returns:
+            Dict[str, str]: The headers dictionary
+        """
+        await self._ensure_token()
+        return self.get_auth_headers()
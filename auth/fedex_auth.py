@@ -1,13 +1,21 @@
 # Fedex Auth
 # TODO: Implement this module
 
-import aiohttp
-from typing import Dict
+from urllib.parse import urlencode
+from typing import Dict, Optional
+
+import orjson
+
 from .base_auth import BaseCarrierAuth
+from utils.http import get_session
 
 class FedExAuth(BaseCarrierAuth):
     """FedEx OAuth2 authentication implementation."""
     
+    __slots__ = ('_base_url', '_token_url', '_token_body', '_cached_headers', '_cached_headers_token')
+    
+    carrier = "fedex"
+    
     def __init__(self, client_id: str, client_secret: str, environment: str = "production"):
         """
         Initialize FedEx authentication handler.
@@ -22,6 +30,15 @@ class FedExAuth(BaseCarrierAuth):
             "https://apis.fedex.com" if environment == "production"
             else "https://apis-sandbox.fedex.com"
         )
+        self._token_url = f"{self._base_url}/oauth/token"
+        # The token request body never changes, so encode it once
+        self._token_body = urlencode({
+            "grant_type": "client_credentials",
+            "client_id": client_id,
+            "client_secret": client_secret
+        }).encode("ascii")
+        self._cached_headers: Dict[str, str] = {}
+        self._cached_headers_token: Optional[Dict] = None
     
     async def get_access_token(self) -> str:
         """
@@ -30,10 +47,8 @@ class FedExAuth(BaseCarrierAuth):
         Returns:
             str: The access token
         """
-        if not self._is_token_valid():
-            token_response = await self._fetch_new_token()
-            self._update_token(token_response)
-        return self._token["access_token"]
+        token = await self._ensure_token()
+        return token["access_token"]
     
     async def _fetch_new_token(self) -> Dict:
         """
@@ -42,28 +57,30 @@ class FedExAuth(BaseCarrierAuth):
         Returns:
             Dict: The token response
         """
-        url = f"{self._base_url}/oauth/token"
-        data = {
-            "grant_type": "client_credentials",
-            "client_id": self.client_id,
-            "client_secret": self.client_secret
-        }
+        headers = {"Content-Type": "application/x-www-form-urlencoded"}
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, data=data) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise Exception(f"Failed to get FedEx token: {error_text}")
-                return await response.json()
+        session = await get_session()
+        async with session.post(self._token_url, headers=headers, data=self._token_body) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                raise Exception(f"Failed to get FedEx token: {error_text}")
+            return orjson.loads(await response.read())
     
     def get_auth_headers(self) -> Dict[str, str]:
         """
         Get the authentication headers for FedEx API requests.
         
+        The headers are rebuilt only when the token rotates, so callers share
+        one dict and must not mutate it.
+        
         Returns:
             Dict[str, str]: The headers dictionary
         """
-        return {
-            "Authorization": f"Bearer {self._token['access_token']}",
-            "Content-Type": "application/json"
-        }
+        token = self._token
+        if token is not self._cached_headers_token:
+            self._cached_headers = {
+                "Authorization": f"Bearer {token['access_token']}",
+                "Content-Type": "application/json"
+            }
+            self._cached_headers_token = token
+        return self._cached_headers
@@ -0,0 +1,65 @@
+"""Background refresh of carrier OAuth tokens."""
+
+from contextlib import suppress
+from typing import Optional, TYPE_CHECKING
+import asyncio
+
+from utils.log import logger
+
+if TYPE_CHECKING:
+    from auth import AuthManager
+
+class TokenRefresher:
+    """Refreshes carrier tokens in the background before they expire."""
+    
+    def __init__(self, auth_manager: "AuthManager", interval: float = 60.0):
+        """
+        Initialize the token refresher.
+        
+        Args:
+            auth_manager (AuthManager): The auth manager whose carriers are refreshed
+            interval (float): Seconds between refresh checks
+        """
+        self.auth_manager = auth_manager
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self) -> None:
+        """Start the refresh loop on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """Stop the refresh loop."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+    
+    async def refresh_due(self) -> None:
+        """
+        Refresh every carrier token that would expire before the next check.
+        
+        Tokens are refreshed two intervals ahead of their deadline so that
+        request handlers almost never have to refresh inline; the inline
+        refresh remains as a fallback for missed ticks.
+        """
+        auths = [
+            auth for auth in (self.auth_manager.fedex_auth, self.auth_manager.ups_auth)
+            if auth is not None and auth.seconds_until_refresh() < self.interval * 2
+        ]
+        results = await asyncio.gather(
+            *(auth.refresh_token() for auth in auths),
+            return_exceptions=True
+        )
+        for auth, result in zip(auths, results):
+            if isinstance(result, Exception):
+                logger.warning("Background %s token refresh failed: %s", auth.carrier, result)
+    
+    async def _run(self) -> None:
+        """Run refresh checks until cancelled."""
+        while True:
+            await self.refresh_due()
+            await asyncio.sleep(self.interval)
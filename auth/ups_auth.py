@@ -1,13 +1,21 @@
 # Ups Auth
 # TODO: Implement this module
 
-import aiohttp
-from typing import Dict
+from urllib.parse import urlencode
+from typing import Dict, Optional
+
+import orjson
+
 from .base_auth import BaseCarrierAuth
+from utils.http import get_session
 
 class UPSAuth(BaseCarrierAuth):
     """UPS OAuth2 authentication implementation."""
     
+    __slots__ = ('_base_url', '_token_url', '_token_body', '_header_template', '_cached_headers', '_cached_headers_token')
+    
+    carrier = "ups"
+    
     def __init__(self, client_id: str, client_secret: str, environment: str = "production"):
         """
         Initialize UPS authentication handler.
@@ -22,6 +30,19 @@ class UPSAuth(BaseCarrierAuth):
             "https://onlinetools.ups.com" if environment == "production"
             else "https://wwwcie.ups.com"
         )
+        self._token_url = f"{self._base_url}/security/v1/oauth/token"
+        # The token request body never changes, so encode it once
+        self._token_body = urlencode({
+            "grant_type": "client_credentials",
+            "client_id": client_id,
+            "client_secret": client_secret
+        }).encode("ascii")
+        self._header_template = {
+            "Content-Type": "application/json",
+            "x-merchant-id": client_id
+        }
+        self._cached_headers: Dict[str, str] = {}
+        self._cached_headers_token: Optional[Dict] = None
     
     async def get_access_token(self) -> str:
         """
@@ -30,10 +51,8 @@ class UPSAuth(BaseCarrierAuth):
         Returns:
             str: The access token
         """
-        if not self._is_token_valid():
-            token_response = await self._fetch_new_token()
-            self._update_token(token_response)
-        return self._token["access_token"]
+        token = await self._ensure_token()
+        return token["access_token"]
     
     async def _fetch_new_token(self) -> Dict:
         """
@@ -42,33 +61,33 @@ class UPSAuth(BaseCarrierAuth):
         Returns:
             Dict: The token response
         """
-        url = f"{self._base_url}/security/v1/oauth/token"
         headers = {
             "Content-Type": "application/x-www-form-urlencoded",
             "x-merchant-id": self.client_id
         }
-        data = {
-            "grant_type": "client_credentials",
-            "client_id": self.client_id,
-            "client_secret": self.client_secret
-        }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, data=data) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise Exception(f"Failed to get UPS token: {error_text}")
-                return await response.json()
+        session = await get_session()
+        async with session.post(self._token_url, headers=headers, data=self._token_body) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                raise Exception(f"Failed to get UPS token: {error_text}")
+            return orjson.loads(await response.read())
     
     def get_auth_headers(self) -> Dict[str, str]:
         """
         Get the authentication headers for UPS API requests.
         
+        The headers are rebuilt only when the token rotates, so callers share
+        one dict and must not mutate it.
+        
         Returns:
             Dict[str, str]: The headers dictionary
         """
-        return {
-            "Authorization": f"Bearer {self._token['access_token']}",
-            "Content-Type": "application/json",
-            "x-merchant-id": self.client_id
-        }
+        token = self._token
+        if token is not self._cached_headers_token:
+            self._cached_headers = {
+                **self._header_template,
+                "Authorization": f"Bearer {token['access_token']}"
+            }
+            self._cached_headers_token = token
+        return self._cached_headers
@@ -1,7 +1,9 @@
 #   Init  
 # TODO: Implement this module
 
-from typing import Dict, Type, Any
+from typing import Dict, List, Type, Any
+import asyncio
+import threading
 from .label_creator import (
     LabelCreator, 
     LabelRequest, 
@@ -20,11 +22,31 @@ class LabelManager:
     def __init__(self, auth_manager: AuthManager):
         self.auth_manager = auth_manager
         self._creators: Dict[str, LabelCreator] = {}
+        # One lock per supported carrier so a slow FedEx init never blocks UPS
+        self._init_locks: Dict[str, asyncio.Lock] = {
+            'fedex': asyncio.Lock(),
+            'ups': asyncio.Lock()
+        }
         
     async def get_creator(self, carrier: str) -> LabelCreator:
         """
         Get a label creator for the specified carrier.
         
+        Args:
+            carrier (str): The carrier name ('FedEx' or 'UPS')
+            
+        Returns:
+            LabelCreator: The label creator instance
+            
+        Raises:
+            ValueError: If the carrier is not supported
+        """
+        return self._creators.get(carrier) or await self._ensure_creator(carrier)
+    
+    async def _ensure_creator(self, carrier: str) -> LabelCreator:
+        """
+        Create and cache the label creator for a carrier on first use.
+        
         Args:
             carrier (str): The carrier name ('FedEx' or 'UPS')
             
@@ -35,16 +57,23 @@ class LabelManager:
             ValueError: If the carrier is not supported
         """
         carrier = carrier.lower()
-        if carrier not in self._creators:
-            if carrier == 'fedex':
-                auth = await self.auth_manager.get_fedex_auth()
-                self._creators[carrier] = FedExLabelCreator(auth)
-            elif carrier == 'ups':
-                auth = await self.auth_manager.get_ups_auth()
-                self._creators[carrier] = UPSLabelCreator(auth)
-            else:
-                raise ValueError(f"Unsupported carrier: {carrier}")
-        return self._creators[carrier]
+        # Reject unknown carriers up front; the carrier may come straight from
+        # a query parameter
+        lock = self._init_locks.get(carrier)
+        if lock is None:
+            raise ValueError(f"Unsupported carrier: {carrier}")
+        
+        async with lock:
+            creator = self._creators.get(carrier)
+            if creator is None:
+                if carrier == 'fedex':
+                    auth = await self.auth_manager.get_fedex_auth()
+                    creator = FedExLabelCreator(auth)
+                else:
+                    auth = await self.auth_manager.get_ups_auth()
+                    creator = UPSLabelCreator(auth)
+                self._creators[carrier] = creator
+        return creator
     
     async def create_label(self, carrier: str, request: LabelRequest) -> LabelResponse:
         """
@@ -61,9 +90,45 @@ class LabelManager:
             ValueError: If the carrier is not supported
             LabelError: If label generation fails
         """
-        creator = await self.get_creator(carrier)
+        creator = self._creators.get(carrier) or await self._ensure_creator(carrier)
         return await creator.create_label(request)
     
+    async def create_labels(self, carrier: str, requests: List[LabelRequest]) -> List[LabelResponse]:
+        """
+        Create several shipping labels for the specified carrier concurrently.
+        
+        Args:
+            carrier (str): The carrier name ('FedEx' or 'UPS')
+            requests (List[LabelRequest]): The label generation requests
+            
+        Returns:
+            List[LabelResponse]: The generated labels, in request order
+            
+        Raises:
+            ValueError: If the carrier is not supported
+            LabelError: If any label generation fails
+        """
+        creator = self._creators.get(carrier) or await self._ensure_creator(carrier)
+        return await creator.create_labels(requests)
+    
+    async def fetch_label_bytes(self, carrier: str, response: LabelResponse) -> bytes:
+        """
+        Get a label's document bytes for the specified carrier.
+        
+        Args:
+            carrier (str): The carrier name ('FedEx' or 'UPS')
+            response (LabelResponse): A response returned by create_label
+            
+        Returns:
+            bytes: The label document
+            
+        Raises:
+            ValueError: If the carrier is not supported
+            LabelError: If the label cannot be downloaded
+        """
+        creator = self._creators.get(carrier) or await self._ensure_creator(carrier)
+        return await creator.fetch_label_bytes(response)
+    
     async def void_label(self, carrier: str, tracking_number: str) -> bool:
         """
         Void a shipping label for the specified carrier.
@@ -79,7 +144,7 @@ class LabelManager:
             ValueError: If the carrier is not supported
             LabelError: If voiding fails
         """
-        creator = await self.get_creator(carrier)
+        creator = self._creators.get(carrier) or await self._ensure_creator(carrier)
         return await creator.void_label(tracking_number)
     
     async def get_label_status(self, carrier: str, tracking_number: str) -> Dict[str, Any]:
@@ -97,11 +162,12 @@ class LabelManager:
             ValueError: If the carrier is not supported
             LabelError: If status check fails
         """
-        creator = await self.get_creator(carrier)
+        creator = self._creators.get(carrier) or await self._ensure_creator(carrier)
         return await creator.get_label_status(tracking_number)
 
 # Create a singleton instance
 _label_manager: LabelManager = None
+_label_manager_lock = threading.Lock()
 
 def get_label_manager(auth_manager: AuthManager = None) -> LabelManager:
     """
@@ -116,9 +182,11 @@ def get_label_manager(auth_manager: AuthManager = None) -> LabelManager:
     """
     global _label_manager
     if _label_manager is None:
-        if auth_manager is None:
-            auth_manager = get_auth_manager()
-        _label_manager = LabelManager(auth_manager)
+        with _label_manager_lock:
+            if _label_manager is None:
+                if auth_manager is None:
+                    auth_manager = get_auth_manager()
+                _label_manager = LabelManager(auth_manager)
     return _label_manager
 
 __all__ = [
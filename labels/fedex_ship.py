@@ -1,14 +1,24 @@
+import asyncio
 import aiohttp
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Any, Optional
-import base64
+
+import orjson
+
 from auth import auth_manager
 from utils.exceptions import LabelError
+from utils.http import get_session
 from labels.label_creator import LabelCreator, LabelRequest, LabelResponse, Address, Package
 
 class FedExLabelCreator(LabelCreator):
     """FedEx implementation of label creation using REST APIs."""
     
+    _LABEL_SPECIFICATION = {
+        "imageType": "PDF",
+        "labelStockType": "PAPER_85X11_TOP_HALF_LABEL"
+    }
+    _RATE_REQUEST_TYPES = ("ACCOUNT",)
+    
     def __init__(self, environment: str = "production"):
         """
         Initialize FedEx label creator.
@@ -21,14 +31,37 @@ class FedExLabelCreator(LabelCreator):
             else "https://apis-sandbox.fedex.com"
         )
     
+    async def _headers(self) -> Dict[str, str]:
+        """
+        Get FedEx API headers with a valid bearer token.
+        
+        Returns:
+            Dict[str, str]: The headers dictionary
+        """
+        auth = await auth_manager.get_fedex_auth()
+        return await auth.get_valid_auth_headers()
+    
     async def create_label(self, request: LabelRequest) -> LabelResponse:
         """Create a FedEx shipping label."""
-        auth = await auth_manager.get_fedex_auth()
-        headers = await auth.get_auth_headers()
+        headers = await self._headers()
         
         url = f"{self._base_url}/ship/v1/shipments"
         
-        # Build FedEx REST API payload
+        # Build FedEx REST API payload; constant subtrees are shared class
+        # attributes and must not be mutated
+        email_recipients = []
+        if request.from_address.email:
+            email_recipients.append({
+                "emailAddress": request.from_address.email,
+                "notificationTypes": ["SHIP"]
+            })
+        if request.to_address.email:
+            email_recipients.append({
+                "emailAddress": request.to_address.email,
+                "notificationTypes": ["DELIVERY"]
+            })
+        
+        package = request.package
         payload = {
             "labelResponseOptions": "URL_ONLY",
             "requestedShipment": {
@@ -36,52 +69,38 @@ class FedExLabelCreator(LabelCreator):
                 "recipients": [self._format_address(request.to_address)],
                 "serviceType": request.service_code,
                 "emailNotificationDetail": {
-                    "recipients": []
+                    "recipients": email_recipients
                 },
-                "labelSpecification": {
-                    "imageType": "PDF",
-                    "labelStockType": "PAPER_85X11_TOP_HALF_LABEL"
-                },
-                "rateRequestTypes": ["ACCOUNT"],
+                "labelSpecification": self._LABEL_SPECIFICATION,
+                "rateRequestTypes": self._RATE_REQUEST_TYPES,
                 "pickupType": "USE_SCHEDULED_PICKUP",
-                "packagingType": request.package.packaging_type,
-                "totalWeight": request.package.weight,
+                "packagingType": package.packaging_type,
+                "totalWeight": package.weight,
                 "requestedPackageLineItems": [{
                     "weight": {
-                        "value": request.package.weight,
+                        "value": package.weight,
                         "units": "LB"
                     },
                     "dimensions": {
-                        "length": request.package.length,
-                        "width": request.package.width,
-                        "height": request.package.height,
+                        "length": package.length,
+                        "width": package.width,
+                        "height": package.height,
                         "units": "IN"
                     }
                 }]
             }
         }
         
-        # Add email notifications if available
-        if request.from_address.email:
-            payload["requestedShipment"]["emailNotificationDetail"]["recipients"].append({
-                "emailAddress": request.from_address.email,
-                "notificationTypes": ["SHIP"]
-            })
-        if request.to_address.email:
-            payload["requestedShipment"]["emailNotificationDetail"]["recipients"].append({
-                "emailAddress": request.to_address.email,
-                "notificationTypes": ["DELIVERY"]
-            })
-        
         # Add optional services
+        shipment = payload["requestedShipment"]
         if request.insurance_amount:
-            payload["requestedShipment"]["totalInsuredValue"] = {
+            shipment["totalInsuredValue"] = {
                 "amount": request.insurance_amount,
                 "currency": "USD"
             }
         
         if request.signature_required:
-            payload["requestedShipment"]["specialServicesRequested"] = {
+            shipment["specialServicesRequested"] = {
                 "specialServiceTypes": ["SIGNATURE_OPTION"],
                 "signatureOptionDetail": {
                     "signatureOptionType": "DIRECT"
@@ -89,28 +108,31 @@ class FedExLabelCreator(LabelCreator):
             }
         
         if request.saturday_delivery:
-            if "specialServicesRequested" not in payload["requestedShipment"]:
-                payload["requestedShipment"]["specialServicesRequested"] = {
+            if "specialServicesRequested" not in shipment:
+                shipment["specialServicesRequested"] = {
                     "specialServiceTypes": []
                 }
-            payload["requestedShipment"]["specialServicesRequested"]["specialServiceTypes"].append("SATURDAY_DELIVERY")
+            shipment["specialServicesRequested"]["specialServiceTypes"].append("SATURDAY_DELIVERY")
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, json=payload) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise LabelError(f"FedEx label creation failed: {error_text}")
-                    
-                    data = await response.json()
-                    return self._parse_response(data)
-        except Exception as e:
+            session = await get_session()
+            async with session.post(url, headers=headers, json=payload) as response:
+                # Read the body once and only decode it as text on failure
+                raw = await response.read()
+                if response.status != 200:
+                    error_text = raw[:512].decode("utf-8", "replace")
+                    raise LabelError(f"FedEx label creation failed: {error_text}")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             raise LabelError(f"Failed to create FedEx label: {str(e)}")
+        
+        try:
+            return self._parse_response(orjson.loads(raw), created_at=datetime.now(timezone.utc))
+        except (KeyError, IndexError, ValueError) as e:
+            raise LabelError(f"Unexpected FedEx label response: {str(e)}")
     
     async def void_label(self, tracking_number: str) -> bool:
         """Void a FedEx shipping label."""
-        auth = await auth_manager.get_fedex_auth()
-        headers = await auth.get_auth_headers()
+        headers = await self._headers()
         
         url = f"{self._base_url}/ship/v1/shipments/cancel"
         payload = {
@@ -119,18 +141,17 @@ class FedExLabelCreator(LabelCreator):
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.put(url, headers=headers, json=payload) as response:
-                    if response.status == 200:
-                        return True
-                    return False
-        except Exception as e:
+            session = await get_session()
+            async with session.put(url, headers=headers, json=payload) as response:
+                if response.status == 200:
+                    return True
+                return False
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             raise LabelError(f"Failed to void FedEx label: {str(e)}")
     
     async def get_label_status(self, tracking_number: str) -> Dict[str, Any]:
         """Get FedEx label status."""
-        auth = await auth_manager.get_fedex_auth()
-        headers = await auth.get_auth_headers()
+        headers = await self._headers()
         
         url = f"{self._base_url}/track/v1/trackingnumbers"
         payload = {
@@ -143,23 +164,33 @@ class FedExLabelCreator(LabelCreator):
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, json=payload) as response:
-                    if response.status != 200:
-                        raise LabelError("Failed to get label status")
-                    return await response.json()
-        except Exception as e:
+            session = await get_session()
+            async with session.post(url, headers=headers, json=payload) as response:
+                if response.status != 200:
+                    raise LabelError("Failed to get label status")
+                return orjson.loads(await response.read())
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             raise LabelError(f"Failed to get FedEx label status: {str(e)}")
     
     def _format_address(self, address: Address) -> Dict[str, Any]:
         """Format address for FedEx REST API."""
-        formatted = {
-            "contact": {
-                "personName": address.name,
-                "phoneNumber": address.phone
-            },
+        street_lines = [address.street1]
+        if address.street2:
+            street_lines.append(address.street2)
+            
+        contact = {
+            "personName": address.name,
+            "phoneNumber": address.phone
+        }
+        if address.company:
+            contact["companyName"] = address.company
+        if address.email:
+            contact["emailAddress"] = address.email
+            
+        return {
+            "contact": contact,
             "address": {
-                "streetLines": [address.street1] + ([address.street2] if address.street2 else []),
+                "streetLines": street_lines,
                 "city": address.city,
                 "stateOrProvinceCode": address.state,
                 "postalCode": address.zip_code,
@@ -167,30 +198,33 @@ class FedExLabelCreator(LabelCreator):
                 "residential": True
             }
         }
+    
+    def _parse_response(self, data: Dict[str, Any],
+                        created_at: Optional[datetime] = None) -> LabelResponse:
+        """
+        Parse FedEx REST API response into LabelResponse.
         
-        if address.company:
-            formatted["contact"]["companyName"] = address.company
-            
-        if address.email:
-            formatted["contact"]["emailAddress"] = address.email
+        Args:
+            data (Dict[str, Any]): The API response data
+            created_at (Optional[datetime]): When the response arrived; defaults to now (UTC)
             
-        return formatted
-    
-    def _parse_response(self, data: Dict[str, Any]) -> LabelResponse:
-        """Parse FedEx REST API response into LabelResponse."""
+        Returns:
+            LabelResponse: The parsed label
+        """
         output = data["output"]
         shipment = output["transactionShipments"][0]
+        delivery_date = shipment["completedShipmentDetail"]["operationalDetail"].get("deliveryDate")
         
         return LabelResponse(
             tracking_number=shipment["masterTrackingNumber"],
-            label_data=base64.b64decode(shipment["pieceResponses"][0]["packageDocuments"][0]["url"]),
+            # URL_ONLY responses link to the document rather than embedding it;
+            # the bytes are downloaded on demand by fetch_label_bytes
+            label_data=b"",
+            label_url=shipment["pieceResponses"][0]["packageDocuments"][0]["url"],
             label_format="PDF",
             carrier="FedEx",
             service=shipment["serviceType"],
             cost=float(shipment["completedShipmentDetail"]["shipmentRating"]["totalNetFedExCharge"]),
-            created_at=datetime.now(),
-            estimated_delivery=datetime.strptime(
-                shipment["completedShipmentDetail"]["operationalDetail"]["deliveryDate"],
-                "%Y-%m-%d"
-            ) if "deliveryDate" in shipment["completedShipmentDetail"]["operationalDetail"] else None
+            created_at=created_at or datetime.now(timezone.utc),
+            estimated_delivery=datetime.fromisoformat(delivery_date) if delivery_date else None
         )
@@ -3,10 +3,14 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import datetime
+import asyncio
+import aiohttp
+from utils.exceptions import LabelError
+from utils.http import get_session
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Address:
     """Represents a shipping address."""
     name: str
@@ -20,7 +24,7 @@ class Address:
     phone: str
     email: Optional[str]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Package:
     """Represents package details."""
     weight: float  # in pounds
@@ -30,7 +34,7 @@ class Package:
     packaging_type: str
     reference: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LabelRequest:
     """Represents a label generation request."""
     from_address: Address
@@ -43,7 +47,7 @@ class LabelRequest:
     saturday_delivery: bool = False
     reference: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class LabelResponse:
     """Represents a label generation response."""
     tracking_number: str
@@ -55,6 +59,7 @@ class LabelResponse:
     created_at: datetime
     estimated_delivery: Optional[datetime] = None
     qr_code: Optional[bytes] = None
+    label_url: Optional[str] = None  # carrier-hosted document, when label_data is empty
 
 class LabelCreator(ABC):
     """Abstract base class for carrier-specific label creation."""
@@ -75,6 +80,55 @@ class LabelCreator(ABC):
         """
         pass
     
+    async def create_labels(self, requests: List[LabelRequest]) -> List[LabelResponse]:
+        """
+        Create several shipping labels concurrently.
+        
+        The requests share the carrier's pooled HTTP session and cached auth
+        headers, so they overlap on the wire instead of running back to back.
+        
+        Args:
+            requests (List[LabelRequest]): The label generation requests
+            
+        Returns:
+            List[LabelResponse]: The generated labels, in request order
+            
+        Raises:
+            LabelError: If any label generation fails
+        """
+        return list(await asyncio.gather(*(self.create_label(r) for r in requests)))
+    
+    async def fetch_label_bytes(self, response: LabelResponse) -> bytes:
+        """
+        Get the label document bytes, downloading them from the carrier if needed.
+        
+        The downloaded bytes are stored on the response, so repeated calls do
+        not refetch.
+        
+        Args:
+            response (LabelResponse): A response returned by create_label
+            
+        Returns:
+            bytes: The label document
+            
+        Raises:
+            LabelError: If the label has no data and cannot be downloaded
+        """
+        if response.label_data:
+            return response.label_data
+        if not response.label_url:
+            raise LabelError(f"No label document for {response.tracking_number}")
+        
+        try:
+            session = await get_session()
+            async with session.get(response.label_url) as resp:
+                if resp.status != 200:
+                    raise LabelError(f"Failed to download label: HTTP {resp.status}")
+                response.label_data = await resp.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise LabelError(f"Failed to download label: {str(e)}")
+        return response.label_data
+    
     @abstractmethod
     async def void_label(self, tracking_number: str) -> bool:
         """
@@ -2,16 +2,29 @@
 # TODO: Implement this module
 
 from typing import Dict, Any, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 import base64
-import aiohttp
+
+import orjson
+
 from auth import auth_manager
 from utils.exceptions import LabelError
+from utils.http import get_session
 from labels.label_creator import LabelCreator, LabelRequest, LabelResponse, Address, Package
 
 class UPSLabelCreator(LabelCreator):
     """UPS implementation of the label creator using REST APIs."""
     
+    _DIMENSION_UNITS = {"Code": "IN", "Description": "Inches"}
+    _WEIGHT_UNITS = {"Code": "LBS", "Description": "Pounds"}
+    _LABEL_SPECIFICATION = {
+        "LabelImageFormat": {
+            "Code": "PDF",
+            "Description": "PDF"
+        },
+        "HTTPUserAgent": "Mozilla/4.5"
+    }
+    
     def __init__(self, environment: str = "production"):
         """
         Initialize UPS label creator.
@@ -27,11 +40,14 @@ class UPSLabelCreator(LabelCreator):
     async def create_label(self, request: LabelRequest) -> LabelResponse:
         """Create a UPS shipping label."""
         auth = await auth_manager.get_ups_auth()
-        headers = await auth.get_auth_headers()
+        headers = await auth.get_valid_auth_headers()
         
         url = f"{self._base_url}/api/shipments/v1/ship"
         
-        # Build UPS REST API payload
+        # Build UPS REST API payload; constant subtrees are shared class
+        # attributes and must not be mutated
+        package = request.package
+        shipper = self._format_address(request.from_address)
         payload = {
             "ShipmentRequest": {
                 "Request": {
@@ -42,9 +58,9 @@ class UPSLabelCreator(LabelCreator):
                 },
                 "Shipment": {
                     "Description": "Shipping Label",
-                    "Shipper": self._format_address(request.from_address),
+                    "Shipper": shipper,
                     "ShipTo": self._format_address(request.to_address),
-                    "ShipFrom": self._format_address(request.from_address),
+                    "ShipFrom": shipper,
                     "PaymentInformation": {
                         "ShipmentCharge": {
                             "Type": "01",
@@ -60,41 +76,30 @@ class UPSLabelCreator(LabelCreator):
                     "Package": {
                         "Description": "",
                         "Packaging": {
-                            "Code": request.package.packaging_type,
+                            "Code": package.packaging_type,
                             "Description": ""
                         },
                         "Dimensions": {
-                            "UnitOfMeasurement": {
-                                "Code": "IN",
-                                "Description": "Inches"
-                            },
-                            "Length": str(request.package.length),
-                            "Width": str(request.package.width),
-                            "Height": str(request.package.height)
+                            "UnitOfMeasurement": self._DIMENSION_UNITS,
+                            "Length": str(package.length),
+                            "Width": str(package.width),
+                            "Height": str(package.height)
                         },
                         "PackageWeight": {
-                            "UnitOfMeasurement": {
-                                "Code": "LBS",
-                                "Description": "Pounds"
-                            },
-                            "Weight": str(request.package.weight)
+                            "UnitOfMeasurement": self._WEIGHT_UNITS,
+                            "Weight": str(package.weight)
                         }
                     },
                     "ShipmentServiceOptions": {}
                 },
-                "LabelSpecification": {
-                    "LabelImageFormat": {
-                        "Code": "PDF",
-                        "Description": "PDF"
-                    },
-                    "HTTPUserAgent": "Mozilla/4.5"
-                }
+                "LabelSpecification": self._LABEL_SPECIFICATION
             }
         }
         
         # Add optional services
+        shipment = payload["ShipmentRequest"]["Shipment"]
         if request.insurance_amount:
-            payload["ShipmentRequest"]["Shipment"]["Package"]["PackageServiceOptions"] = {
+            shipment["Package"]["PackageServiceOptions"] = {
                 "InsuredValue": {
                     "CurrencyCode": "USD",
                     "MonetaryValue": str(request.insurance_amount)
@@ -102,69 +107,74 @@ class UPSLabelCreator(LabelCreator):
             }
             
         if request.signature_required:
-            if "PackageServiceOptions" not in payload["ShipmentRequest"]["Shipment"]["Package"]:
-                payload["ShipmentRequest"]["Shipment"]["Package"]["PackageServiceOptions"] = {}
-            payload["ShipmentRequest"]["Shipment"]["Package"]["PackageServiceOptions"]["DeliveryConfirmation"] = {
+            if "PackageServiceOptions" not in shipment["Package"]:
+                shipment["Package"]["PackageServiceOptions"] = {}
+            shipment["Package"]["PackageServiceOptions"]["DeliveryConfirmation"] = {
                 "DCISType": "2"  # Signature Required
             }
             
         if request.saturday_delivery:
-            payload["ShipmentRequest"]["Shipment"]["ShipmentServiceOptions"]["SaturdayDeliveryIndicator"] = ""
+            shipment["ShipmentServiceOptions"]["SaturdayDeliveryIndicator"] = ""
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, json=payload) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise LabelError(f"UPS label creation failed: {error_text}")
-                    
-                    data = await response.json()
-                    return self._parse_response(data)
+            session = await get_session()
+            async with session.post(url, headers=headers, json=payload) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise LabelError(f"UPS label creation failed: {error_text}")
+                
+                data = orjson.loads(await response.read())
+                return self._parse_response(data, created_at=datetime.now(timezone.utc))
         except Exception as e:
             raise LabelError(f"Failed to create UPS label: {str(e)}")
     
     async def void_label(self, tracking_number: str) -> bool:
         """Void a UPS shipping label."""
         auth = await auth_manager.get_ups_auth()
-        headers = await auth.get_auth_headers()
+        headers = await auth.get_valid_auth_headers()
         
         url = f"{self._base_url}/api/shipments/v1/void/{tracking_number}"
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.delete(url, headers=headers) as response:
-                    if response.status == 200:
-                        return True
-                    return False
+            session = await get_session()
+            async with session.delete(url, headers=headers) as response:
+                if response.status == 200:
+                    return True
+                return False
         except Exception as e:
             raise LabelError(f"Failed to void UPS label: {str(e)}")
     
     async def get_label_status(self, tracking_number: str) -> Dict[str, Any]:
         """Get UPS label status."""
         auth = await auth_manager.get_ups_auth()
-        headers = await auth.get_auth_headers()
+        headers = await auth.get_valid_auth_headers()
         
         url = f"{self._base_url}/api/track/v1/details/{tracking_number}"
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    if response.status != 200:
-                        raise LabelError("Failed to get label status")
-                    return await response.json()
+            session = await get_session()
+            async with session.get(url, headers=headers) as response:
+                if response.status != 200:
+                    raise LabelError("Failed to get label status")
+                return orjson.loads(await response.read())
         except Exception as e:
             raise LabelError(f"Failed to get UPS label status: {str(e)}")
     
     def _format_address(self, address: Address) -> Dict[str, Any]:
         """Format address for UPS REST API."""
+        address_lines = [address.street1]
+        if address.street2:
+            address_lines.append(address.street2)
+            
+        name = address.name
         formatted = {
-            "Name": address.name,
-            "AttentionName": address.company or address.name,
+            "Name": name,
+            "AttentionName": address.company or name,
             "Phone": {
                 "Number": address.phone
             },
             "Address": {
-                "AddressLine": [address.street1] + ([address.street2] if address.street2 else []),
+                "AddressLine": address_lines,
                 "City": address.city,
                 "StateProvinceCode": address.state,
                 "PostalCode": address.zip_code,
@@ -177,8 +187,18 @@ class UPSLabelCreator(LabelCreator):
             
         return formatted
     
-    def _parse_response(self, data: Dict[str, Any]) -> LabelResponse:
-        """Parse UPS REST API response into LabelResponse."""
+    def _parse_response(self, data: Dict[str, Any],
+                        created_at: Optional[datetime] = None) -> LabelResponse:
+        """
+        Parse UPS REST API response into LabelResponse.
+        
+        Args:
+            data (Dict[str, Any]): The API response data
+            created_at (Optional[datetime]): When the response arrived; defaults to now (UTC)
+            
+        Returns:
+            LabelResponse: The parsed label
+        """
         shipment = data["ShipmentResponse"]["ShipmentResults"]
         
         return LabelResponse(
@@ -188,6 +208,6 @@ class UPSLabelCreator(LabelCreator):
             carrier="UPS",
             service=shipment["ServiceCode"],
             cost=float(shipment["ShipmentCharges"]["TotalCharges"]["MonetaryValue"]),
-            created_at=datetime.now(),
+            created_at=created_at or datetime.now(timezone.utc),
             estimated_delivery=None  # Parse from response if available
         )
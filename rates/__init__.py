@@ -1,7 +1,7 @@
 """Rates module for shipping rate comparison and normalization."""
 from .rate_comparer import RateComparer
-from .service_normalizer import ServiceNormalizer
+from .service_normalizer import ServiceNormalizer, get_normalizer
 from .fedex_rates import FedExRates
 from .ups_rates import UPSRates
 
-__all__ = ['RateComparer', 'ServiceNormalizer', 'FedExRates', 'UPSRates']
+__all__ = ['RateComparer', 'ServiceNormalizer', 'get_normalizer', 'FedExRates', 'UPSRates']
@@ -1,12 +1,32 @@
 # Fedex Rates
 # TODO: Implement this module
 
-import aiohttp
+from functools import partial
 from typing import Dict, List, Optional
 from dataclasses import dataclass
+
+import orjson
+
 from auth.fedex_auth import FedExAuth
+from .rate_cache import RateCache
+from utils.http import get_session
 
-@dataclass
+# Map FedEx transit times to estimated days
+_TRANSIT_DAYS = {
+    "SAME_DAY": 0,
+    "ONE_DAY": 1,
+    "TWO_DAYS": 2,
+    "THREE_DAYS": 3,
+    "FOUR_DAYS": 4,
+    "FIVE_DAYS": 5,
+    "SIX_DAYS": 6,
+    "SEVEN_DAYS": 7,
+    "EIGHT_DAYS": 8,
+    "NINE_DAYS": 9,
+    "TEN_DAYS": 10
+}
+
+@dataclass(slots=True, frozen=True)
 class FedExRateRequest:
     """Represents a FedEx rate request."""
     origin_zip: str
@@ -16,7 +36,7 @@ class FedExRateRequest:
     width: float   # in inches
     height: float  # in inches
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FedExRateResponse:
     """Represents a FedEx rate response."""
     service_name: str
@@ -28,15 +48,18 @@ class FedExRateResponse:
 class FedExRates:
     """Handles rate requests to the FedEx API."""
     
-    def __init__(self, auth: FedExAuth, environment: str = "production"):
+    def __init__(self, auth: FedExAuth, environment: str = "production",
+                 cache_ttl: float = 600.0):
         """
         Initialize the FedEx rates handler.
         
         Args:
             auth (FedExAuth): FedEx authentication handler
             environment (str): 'production' or 'sandbox'
+            cache_ttl (float): Seconds to reuse quotes for identical requests; 0 disables
         """
         self.auth = auth
+        self._cache = RateCache(ttl=cache_ttl)
         self._base_url = (
             "https://apis.fedex.com" if environment == "production"
             else "https://apis-sandbox.fedex.com"
@@ -46,6 +69,27 @@ class FedExRates:
         """
         Get shipping rates from FedEx.
         
+        Quotes for identical requests are reused until the cache TTL expires.
+        
+        Args:
+            request (FedExRateRequest): The rate request details
+            
+        Returns:
+            List[FedExRateResponse]: List of available shipping options
+            
+        Raises:
+            Exception: If the API request fails
+        """
+        key = (
+            request.origin_zip, request.destination_zip, request.weight,
+            request.length, request.width, request.height
+        )
+        return await self._cache.get_or_fetch(key, partial(self._fetch_rates, request))
+    
+    async def _fetch_rates(self, request: FedExRateRequest) -> List[FedExRateResponse]:
+        """
+        Request shipping rates from the FedEx API.
+        
         Args:
             request (FedExRateRequest): The rate request details
             
@@ -56,7 +100,7 @@ class FedExRates:
             Exception: If the API request fails
         """
         url = f"{self._base_url}/rate/v1/rates/quotes"
-        headers = await self.auth.get_auth_headers()
+        headers = await self.auth.get_valid_auth_headers()
         
         payload = {
             "accountNumber": {
@@ -93,14 +137,14 @@ class FedExRates:
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, json=payload) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise Exception(f"FedEx API error: {error_text}")
-                        
-                    data = await response.json()
-                    return self._parse_response(data)
+            session = await get_session()
+            async with session.post(url, headers=headers, json=payload) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise Exception(f"FedEx API error: {error_text}")
+                    
+                data = orjson.loads(await response.read())
+                return self._parse_response(data)
         except Exception as e:
             raise Exception(f"Failed to get FedEx rates: {str(e)}")
     
@@ -114,35 +158,33 @@ class FedExRates:
         Returns:
             List[FedExRateResponse]: List of parsed rate options
         """
-        rate_options = []
+        return [
+            FedExRateResponse(
+                service_name=quote.get("serviceName", ""),
+                service_code=quote.get("serviceType", ""),
+                cost=self._parse_total_cost(quote),
+                estimated_days=self._parse_transit_time(quote.get("transitTime", "")),
+                delivery_date=quote.get("deliveryDate", "")
+            )
+            for quote in data.get("output", {}).get("rateReplyDetails", ())
+        ]
+    
+    def _parse_total_cost(self, quote: Dict) -> float:
+        """
+        Get the total net charge of a FedEx rate quote.
         
-        for quote in data.get("output", {}).get("rateReplyDetails", []):
-            service_name = quote.get("serviceName", "")
-            service_code = quote.get("serviceType", "")
-            
-            # Get the total cost
-            total_cost = 0.0
-            for charge in quote.get("ratedShipmentDetails", [{}])[0].get("shipmentRateDetail", {}).get("totalNetCharge", {}):
-                if charge.get("name") == "Total":
-                    total_cost = float(charge.get("amount", 0))
-                    break
-            
-            # Get estimated transit time
-            transit_time = quote.get("transitTime", "")
-            estimated_days = self._parse_transit_time(transit_time)
-            
-            # Get delivery date
-            delivery_date = quote.get("deliveryDate", "")
+        Args:
+            quote (Dict): A rateReplyDetails entry
             
-            rate_options.append(FedExRateResponse(
-                service_name=service_name,
-                service_code=service_code,
-                cost=total_cost,
-                estimated_days=estimated_days,
-                delivery_date=delivery_date
-            ))
-        
-        return rate_options
+        Returns:
+            float: The total cost, or 0.0 if the quote has no rated details
+        """
+        details = quote.get("ratedShipmentDetails") or ({},)
+        charge = details[0].get("totalNetCharge", 0)
+        # REST v1 returns a bare amount; tolerate the {"amount": ...} money form
+        if isinstance(charge, dict):
+            charge = charge.get("amount", 0)
+        return float(charge)
     
     def _parse_transit_time(self, transit_time: str) -> int:
         """
@@ -154,19 +196,4 @@ class FedExRates:
         Returns:
             int: Estimated days for delivery
         """
-        # Map FedEx transit times to estimated days
-        transit_map = {
-            "SAME_DAY": 0,
-            "ONE_DAY": 1,
-            "TWO_DAYS": 2,
-            "THREE_DAYS": 3,
-            "FOUR_DAYS": 4,
-            "FIVE_DAYS": 5,
-            "SIX_DAYS": 6,
-            "SEVEN_DAYS": 7,
-            "EIGHT_DAYS": 8,
-            "NINE_DAYS": 9,
-            "TEN_DAYS": 10
-        }
-        
-        return transit_map.get(transit_time, 5)  # Default to 5 days if unknown
+        return _TRANSIT_DAYS.get(transit_time, 5)  # Default to 5 days if unknown
@@ -0,0 +1,75 @@
+# Rate Cache
+
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Tuple
+import asyncio
+import time
+
+class RateCache:
+    """Short-lived cache of carrier rate quotes keyed by request signature."""
+    
+    def __init__(self, ttl: float = 600.0, maxsize: int = 4096):
+        """
+        Initialize the rate cache.
+        
+        Args:
+            ttl (float): Seconds a quote stays valid; 0 disables caching
+            maxsize (int): Maximum number of cached quotes
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Tuple[float, List[Any]]] = {}
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+    
+    async def get_or_fetch(self, key: Hashable,
+                           fetch: Callable[[], Awaitable[List[Any]]]) -> List[Any]:
+        """
+        Get cached quotes for a key, fetching them if missing or expired.
+        
+        Concurrent misses for the same key share a single upstream call.
+        Failed fetches are not cached.
+        
+        Args:
+            key (Hashable): The request signature
+            fetch (Callable[[], Awaitable[List[Any]]]): Fetches fresh quotes
+        
+        Returns:
+            List[Any]: The rate quotes
+        """
+        if self.ttl <= 0:
+            return await fetch()
+        
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            return entry[1]
+        
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(partial(self._on_fetched, key))
+        # Shield so one cancelled caller does not cancel the shared fetch
+        return await asyncio.shield(task)
+    
+    def clear(self) -> None:
+        """Drop all cached quotes."""
+        self._entries.clear()
+    
+    def _on_fetched(self, key: Hashable, task: asyncio.Future) -> None:
+        """Store a finished fetch's result."""
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        
+        if len(self._entries) >= self.maxsize:
+            self._evict()
+        self._entries[key] = (time.monotonic() + self.ttl, task.result())
+    
+    def _evict(self) -> None:
+        """Drop expired quotes, or the oldest one if none have expired."""
+        now = time.monotonic()
+        expired = [key for key, (deadline, _) in self._entries.items() if deadline <= now]
+        for key in expired:
+            del self._entries[key]
+        if not expired:
+            del self._entries[next(iter(self._entries))]
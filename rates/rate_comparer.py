@@ -1,11 +1,19 @@
 # Rate Comparer
 # TODO: Implement this module
 
-from typing import List, Dict, Optional, Tuple
+from typing import Any, List, Dict, Optional, Tuple
 from dataclasses import dataclass
+from operator import attrgetter
+import asyncio
 from .service_normalizer import ServiceNormalizer
+from .fedex_rates import FedExRates, FedExRateRequest
+from .ups_rates import UPSRates, UPSRateRequest
+from utils.log import logger
 
-@dataclass
+# C-level sort key shared by every cost ordering below
+_by_cost = attrgetter("cost")
+
+@dataclass(slots=True, frozen=True)
 class RateOption:
     """Represents a shipping rate option from a carrier."""
     carrier: str
@@ -17,70 +25,195 @@ class RateOption:
 class RateComparer:
     """Selects cheapest and fastest viable shipping options."""
     
-    def __init__(self, service_normalizer: ServiceNormalizer):
+    def __init__(self, service_normalizer: ServiceNormalizer,
+                 fedex_rates: Optional[FedExRates] = None,
+                 ups_rates: Optional[UPSRates] = None):
         """
         Initialize the rate comparer.
         
         Args:
             service_normalizer (ServiceNormalizer): Service normalizer instance
+            fedex_rates (Optional[FedExRates]): FedEx rates handler, if configured
+            ups_rates (Optional[UPSRates]): UPS rates handler, if configured
         """
         self.service_normalizer = service_normalizer
+        self.fedex_rates = fedex_rates
+        self.ups_rates = ups_rates
         self._rate_options: List[RateOption] = []
     
-    def add_rate_option(self, carrier: str, service_name: str, cost: float, 
-                       estimated_days: int) -> None:
+    async def fetch_options(self, origin_zip: str, destination_zip: str, weight: float,
+                            length: float, width: float, height: float) -> List[RateOption]:
         """
-        Add a rate option for comparison.
+        Fetch rates from every configured carrier concurrently.
+        
+        A carrier that fails is logged and skipped so one outage does not
+        fail the whole comparison.
+        
+        Args:
+            origin_zip (str): Origin ZIP code
+            destination_zip (str): Destination ZIP code
+            weight (float): Package weight in pounds
+            length (float): Package length in inches
+            width (float): Package width in inches
+            height (float): Package height in inches
+            
+        Returns:
+            List[RateOption]: The normalized rate options from all carriers
+        """
+        carriers: List[str] = []
+        calls: List[Any] = []
+        if self.fedex_rates is not None:
+            carriers.append("FedEx")
+            calls.append(self.fedex_rates.get_rates(FedExRateRequest(
+                origin_zip, destination_zip, weight, length, width, height
+            )))
+        if self.ups_rates is not None:
+            carriers.append("UPS")
+            calls.append(self.ups_rates.get_rates(UPSRateRequest(
+                origin_zip, destination_zip, weight, length, width, height
+            )))
+        
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        
+        options = []
+        for carrier, result in zip(carriers, results):
+            if isinstance(result, BaseException):
+                logger.error("Failed to get %s rates: %s", carrier, result)
+                continue
+            for rate in result:
+                option = self.create_option(
+                    carrier, rate.service_name, rate.cost, rate.estimated_days
+                )
+                if option is not None:
+                    options.append(option)
+        return options
+    
+    async def fetch_and_compare(
+        self, origin_zip: str, destination_zip: str, weight: float,
+        length: float, width: float, height: float
+    ) -> Tuple[Optional[RateOption], Optional[RateOption], List[RateOption]]:
+        """
+        Fetch rates from every configured carrier and compare them.
+        
+        Args:
+            origin_zip (str): Origin ZIP code
+            destination_zip (str): Destination ZIP code
+            weight (float): Package weight in pounds
+            length (float): Package length in inches
+            width (float): Package width in inches
+            height (float): Package height in inches
+            
+        Returns:
+            Tuple[Optional[RateOption], Optional[RateOption], List[RateOption]]:
+                (cheapest_option, cheapest_fastest_option, all_options_by_cost)
+        """
+        options = await self.fetch_options(
+            origin_zip, destination_zip, weight, length, width, height
+        )
+        cheapest, cheapest_fastest = self.select_best_options(options)
+        return cheapest, cheapest_fastest, self.sort_options(options)
+    
+    def create_option(self, carrier: str, service_name: str, cost: float,
+                      estimated_days: int) -> Optional[RateOption]:
+        """
+        Build a normalized rate option without storing it.
         
         Args:
             carrier (str): The carrier name
             service_name (str): The carrier-specific service name
             cost (float): The shipping cost
             estimated_days (int): Estimated delivery time in days
+            
+        Returns:
+            Optional[RateOption]: The rate option, or None if the service is unknown
         """
         try:
             normalized_service = self.service_normalizer.normalize_service(
                 carrier, service_name
             )
-            
-            rate_option = RateOption(
-                carrier=carrier,
-                service_name=service_name,
-                cost=cost,
-                estimated_days=estimated_days,
-                normalized_service=normalized_service
-            )
-            
-            self._rate_options.append(rate_option)
         except ValueError as e:
             # Log the error but continue processing other rates
-            print(f"Warning: {str(e)}")
+            logger.warning("Skipping %s rate for %r: %s", carrier, service_name, e)
+            return None
+            
+        return RateOption(
+            carrier=carrier,
+            service_name=service_name,
+            cost=cost,
+            estimated_days=estimated_days,
+            normalized_service=normalized_service
+        )
     
-    def get_best_options(self) -> Tuple[Optional[RateOption], Optional[RateOption]]:
+    def add_rate_option(self, carrier: str, service_name: str, cost: float, 
+                       estimated_days: int) -> None:
         """
-        Get the cheapest and cheapest/fastest shipping options.
+        Add a rate option for comparison.
         
+        Args:
+            carrier (str): The carrier name
+            service_name (str): The carrier-specific service name
+            cost (float): The shipping cost
+            estimated_days (int): Estimated delivery time in days
+        """
+        rate_option = self.create_option(carrier, service_name, cost, estimated_days)
+        if rate_option is not None:
+            self._rate_options.append(rate_option)
+    
+    @staticmethod
+    def select_best_options(
+        options: List[RateOption]
+    ) -> Tuple[Optional[RateOption], Optional[RateOption]]:
+        """
+        Select the cheapest and cheapest/fastest options from a list.
+        
+        Args:
+            options (List[RateOption]): The rate options to compare
+            
         Returns:
             Tuple[Optional[RateOption], Optional[RateOption]]: 
                 (cheapest_option, cheapest_fastest_option)
         """
-        if not self._rate_options:
+        if not options:
             return None, None
             
-        # Sort by cost
-        sorted_by_cost = sorted(self._rate_options, key=lambda x: x.cost)
-        cheapest = sorted_by_cost[0]
+        # Linear scans; min() keeps the first of equally priced options, as the
+        # stable sort did
+        cheapest = min(options, key=_by_cost)
         
         # Find the cheapest option that's significantly faster than the cheapest
         # We consider "significantly faster" to be at least 2 days faster
-        cheapest_fastest = None
-        for option in sorted_by_cost:
-            if option.estimated_days <= cheapest.estimated_days - 2:
-                if cheapest_fastest is None or option.cost < cheapest_fastest.cost:
-                    cheapest_fastest = option
+        max_days = cheapest.estimated_days - 2
+        cheapest_fastest = min(
+            (option for option in options if option.estimated_days <= max_days),
+            key=_by_cost,
+            default=None
+        )
         
         return cheapest, cheapest_fastest
     
+    @staticmethod
+    def sort_options(options: List[RateOption]) -> List[RateOption]:
+        """
+        Sort rate options by cost.
+        
+        Args:
+            options (List[RateOption]): The rate options to sort
+            
+        Returns:
+            List[RateOption]: The rate options, cheapest first
+        """
+        return sorted(options, key=_by_cost)
+    
+    def get_best_options(self) -> Tuple[Optional[RateOption], Optional[RateOption]]:
+        """
+        Get the cheapest and cheapest/fastest shipping options.
+        
+        Returns:
+            Tuple[Optional[RateOption], Optional[RateOption]]: 
+                (cheapest_option, cheapest_fastest_option)
+        """
+        return self.select_best_options(self._rate_options)
+    
     def get_all_options(self) -> List[RateOption]:
         """
         Get all rate options sorted by cost.
@@ -88,7 +221,7 @@ class RateComparer:
         Returns:
             List[RateOption]: List of rate options
         """
-        return sorted(self._rate_options, key=lambda x: x.cost)
+        return self.sort_options(self._rate_options)
     
     def clear_options(self) -> None:
         """Clear all stored rate options."""
@@ -1,10 +1,54 @@
 # Service Normalizer
 # TODO: Implement this module
 
-import pandas as pd
-from typing import Dict, Optional
+import csv
+import os
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 from pathlib import Path
 
+# Upper bound on memoized normalize_service results before the cache resets
+_CACHE_LIMIT = 256
+
+@lru_cache(maxsize=8)
+def _load_cached(path: str, mtime_ns: int) -> Tuple[Dict[str, Dict[str, str]], Dict[Tuple[str, str], str]]:
+    """
+    Parse a mapping file, reusing the result until the file changes.
+    
+    Args:
+        path (str): Path to the CSV file
+        mtime_ns (int): The file's modification time, so edits invalidate the entry
+        
+    Returns:
+        Tuple: Nested carrier -> service_name -> normalized_service mappings and
+            a flat (carrier, service_name) index for single-probe lookups
+    """
+    mappings: Dict[str, Dict[str, str]] = {}
+    flat: Dict[Tuple[str, str], str] = {}
+    with open(path, newline='') as f:
+        for row in csv.DictReader(f):
+            carrier = row['carrier'].lower()
+            service_name = row['service_name'].lower()
+            mappings.setdefault(carrier, {})[service_name] = row['normalized_service']
+            flat[(carrier, service_name)] = row['normalized_service']
+    return mappings, flat
+
+def _ends_with_newline(path: Path) -> bool:
+    """
+    Check whether a file is empty or ends with a line break.
+    
+    Args:
+        path (Path): The file to check
+        
+    Returns:
+        bool: True if a row appended to the file would start on its own line
+    """
+    with open(path, 'rb') as f:
+        if f.seek(0, os.SEEK_END) == 0:
+            return True
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) in (b'\n', b'\r')
+
 class ServiceNormalizer:
     """Maps carrier-specific service names to normalized tiers for comparison."""
     
@@ -17,27 +61,28 @@ class ServiceNormalizer:
         """
         self.mapping_file = Path(mapping_file)
         self._mappings: Optional[Dict[str, Dict[str, str]]] = None
+        self._flat: Dict[Tuple[str, str], str] = {}
+        self._clear_cache()
         self._load_mappings()
     
     def _load_mappings(self) -> None:
         """Load service mappings from the CSV file."""
         try:
-            df = pd.read_csv(self.mapping_file)
-            self._mappings = {}
-            
-            # Create nested dictionary: carrier -> service_name -> normalized_service
-            for _, row in df.iterrows():
-                carrier = row['carrier'].lower()
-                if carrier not in self._mappings:
-                    self._mappings[carrier] = {}
-                self._mappings[carrier][row['service_name'].lower()] = row['normalized_service']
+            mappings, flat = _load_cached(str(self.mapping_file), self.mapping_file.stat().st_mtime_ns)
         except Exception as e:
             raise Exception(f"Failed to load service mappings: {str(e)}")
+        
+        # Copy so add_mapping does not mutate the shared parse
+        self._mappings = {carrier: dict(services) for carrier, services in mappings.items()}
+        self._flat = dict(flat)
     
     def normalize_service(self, carrier: str, service_name: str) -> str:
         """
         Normalize a carrier-specific service name to a standard tier.
         
+        Results, including unknown services, are memoized per raw
+        (carrier, service_name) pair; carriers only ever return a handful.
+        
         Args:
             carrier (str): The carrier name (e.g., 'fedex', 'ups')
             service_name (str): The carrier-specific service name
@@ -45,6 +90,38 @@ class ServiceNormalizer:
         Returns:
             str: The normalized service tier
             
+        Raises:
+            ValueError: If the service name is not found in the mappings
+        """
+        key = (carrier, service_name)
+        normalized = self._normalized.get(key)
+        if normalized is not None:
+            return normalized
+        error = self._unknown.get(key)
+        if error is not None:
+            raise ValueError(error)
+        
+        if len(self._normalized) + len(self._unknown) >= _CACHE_LIMIT:
+            self._clear_cache()
+        try:
+            normalized = self._lookup(carrier, service_name)
+        except ValueError as e:
+            self._unknown[key] = str(e)
+            raise
+        self._normalized[key] = normalized
+        return normalized
+    
+    def _lookup(self, carrier: str, service_name: str) -> str:
+        """
+        Look up a service in the mappings without memoization.
+        
+        Args:
+            carrier (str): The carrier name
+            service_name (str): The carrier-specific service name
+            
+        Returns:
+            str: The normalized service tier
+            
         Raises:
             ValueError: If the service name is not found in the mappings
         """
@@ -54,13 +131,18 @@ class ServiceNormalizer:
         carrier = carrier.lower()
         service_name = service_name.lower()
         
+        normalized = self._flat.get((carrier, service_name))
+        if normalized is not None:
+            return normalized
+        
         if carrier not in self._mappings:
             raise ValueError(f"Unknown carrier: {carrier}")
-            
-        if service_name not in self._mappings[carrier]:
-            raise ValueError(f"Unknown service name for {carrier}: {service_name}")
-            
-        return self._mappings[carrier][service_name]
+        raise ValueError(f"Unknown service name for {carrier}: {service_name}")
+    
+    def _clear_cache(self) -> None:
+        """Forget memoized normalization results."""
+        self._normalized: Dict[Tuple[str, str], str] = {}
+        self._unknown: Dict[Tuple[str, str], str] = {}
     
     def get_carrier_services(self, carrier: str) -> Dict[str, str]:
         """
@@ -97,24 +179,33 @@ class ServiceNormalizer:
         if carrier not in self._mappings:
             self._mappings[carrier] = {}
             
-        self._mappings[carrier][service_name.lower()] = normalized_service
+        service_name = service_name.lower()
+        self._mappings[carrier][service_name] = normalized_service
+        self._flat[(carrier, service_name)] = normalized_service
+        self._clear_cache()
         
-        # Update the CSV file
-        self._save_mappings()
+        # Append to the CSV file; on reload, later rows override earlier ones
+        self._append_mapping(carrier, service_name, normalized_service)
+        _load_cached.cache_clear()
     
-    def _save_mappings(self) -> None:
-        """Save the current mappings to the CSV file."""
-        if not self._mappings:
-            return
-            
-        rows = []
-        for carrier, services in self._mappings.items():
-            for service_name, normalized_service in services.items():
-                rows.append({
-                    'carrier': carrier,
-                    'service_name': service_name,
-                    'normalized_service': normalized_service
-                })
-                
-        df = pd.DataFrame(rows)
-        df.to_csv(self.mapping_file, index=False)
+    def _append_mapping(self, carrier: str, service_name: str, normalized_service: str) -> None:
+        """Append a single mapping row to the CSV file."""
+        needs_newline = not _ends_with_newline(self.mapping_file)
+        with open(self.mapping_file, 'a', newline='') as f:
+            # Terminate a hand-edited last row first, or the new row is glued onto it
+            if needs_newline:
+                f.write('\n')
+            csv.writer(f, lineterminator='\n').writerow((carrier, service_name, normalized_service))
+
+@lru_cache(maxsize=None)
+def get_normalizer(mapping_file: str = "data/normalized_services.csv") -> ServiceNormalizer:
+    """
+    Get the shared service normalizer for a mapping file.
+    
+    Args:
+        mapping_file (str): Path to the CSV file containing service mappings
+        
+    Returns:
+        ServiceNormalizer: The normalizer instance, created on first use
+    """
+    return ServiceNormalizer(mapping_file)
@@ -1,12 +1,17 @@
 # Ups Rates
 # TODO: Implement this module
 
-import aiohttp
+from functools import partial
 from typing import Dict, List, Optional
 from dataclasses import dataclass
+
+import orjson
+
 from auth.ups_auth import UPSAuth
+from .rate_cache import RateCache
+from utils.http import get_session
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UPSRateRequest:
     """Represents a UPS rate request."""
     origin_zip: str
@@ -16,7 +21,7 @@ class UPSRateRequest:
     width: float   # in inches
     height: float  # in inches
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UPSRateResponse:
     """Represents a UPS rate response."""
     service_name: str
@@ -28,15 +33,32 @@ class UPSRateResponse:
 class UPSRates:
     """Handles rate requests to the UPS API."""
     
-    def __init__(self, auth: UPSAuth, environment: str = "production"):
+    # Constant parts of the rate request, shared by every payload
+    _REQUEST = {
+        "SubVersion": "1707",
+        "RequestOption": "Shop",
+        "TransactionReference": {
+            "CustomerContext": "Rate Request"
+        }
+    }
+    _PICKUP_TYPE = {"Code": "01"}  # Daily Pickup
+    _CUSTOMER_CLASSIFICATION = {"Code": "01"}  # Standard
+    _PACKAGING_TYPE = {"Code": "02"}  # Package
+    _DIMENSION_UNITS = {"Code": "IN"}
+    _WEIGHT_UNITS = {"Code": "LBS"}
+    
+    def __init__(self, auth: UPSAuth, environment: str = "production",
+                 cache_ttl: float = 600.0):
         """
         Initialize the UPS rates handler.
         
         Args:
             auth (UPSAuth): UPS authentication handler
             environment (str): 'production' or 'sandbox'
+            cache_ttl (float): Seconds to reuse quotes for identical requests; 0 disables
         """
         self.auth = auth
+        self._cache = RateCache(ttl=cache_ttl)
         self._base_url = (
             "https://onlinetools.ups.com" if environment == "production"
             else "https://wwwcie.ups.com"
@@ -46,6 +68,27 @@ class UPSRates:
         """
         Get shipping rates from UPS.
         
+        Quotes for identical requests are reused until the cache TTL expires.
+        
+        Args:
+            request (UPSRateRequest): The rate request details
+            
+        Returns:
+            List[UPSRateResponse]: List of available shipping options
+            
+        Raises:
+            Exception: If the API request fails
+        """
+        key = (
+            request.origin_zip, request.destination_zip, request.weight,
+            request.length, request.width, request.height
+        )
+        return await self._cache.get_or_fetch(key, partial(self._fetch_rates, request))
+    
+    async def _fetch_rates(self, request: UPSRateRequest) -> List[UPSRateResponse]:
+        """
+        Request shipping rates from the UPS API.
+        
         Args:
             request (UPSRateRequest): The rate request details
             
@@ -56,23 +99,13 @@ class UPSRates:
             Exception: If the API request fails
         """
         url = f"{self._base_url}/api/rating/v1/Shop"
-        headers = await self.auth.get_auth_headers()
+        headers = await self.auth.get_valid_auth_headers()
         
         payload = {
             "RateRequest": {
-                "Request": {
-                    "SubVersion": "1707",
-                    "RequestOption": "Shop",
-                    "TransactionReference": {
-                        "CustomerContext": "Rate Request"
-                    }
-                },
-                "PickupType": {
-                    "Code": "01"  # Daily Pickup
-                },
-                "CustomerClassification": {
-                    "Code": "01"  # Standard
-                },
+                "Request": self._REQUEST,
+                "PickupType": self._PICKUP_TYPE,
+                "CustomerClassification": self._CUSTOMER_CLASSIFICATION,
                 "Shipment": {
                     "Shipper": {
                         "Address": {
@@ -87,21 +120,15 @@ class UPSRates:
                         }
                     },
                     "Package": {
-                        "PackagingType": {
-                            "Code": "02"  # Package
-                        },
+                        "PackagingType": self._PACKAGING_TYPE,
                         "Dimensions": {
-                            "UnitOfMeasurement": {
-                                "Code": "IN"
-                            },
+                            "UnitOfMeasurement": self._DIMENSION_UNITS,
                             "Length": str(request.length),
                             "Width": str(request.width),
                             "Height": str(request.height)
                         },
                         "PackageWeight": {
-                            "UnitOfMeasurement": {
-                                "Code": "LBS"
-                            },
+                            "UnitOfMeasurement": self._WEIGHT_UNITS,
                             "Weight": str(request.weight)
                         }
                     }
@@ -110,14 +137,14 @@ class UPSRates:
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, json=payload) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise Exception(f"UPS API error: {error_text}")
-                        
-                    data = await response.json()
-                    return self._parse_response(data)
+            session = await get_session()
+            async with session.post(url, headers=headers, json=payload) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise Exception(f"UPS API error: {error_text}")
+                    
+                data = orjson.loads(await response.read())
+                return self._parse_response(data)
         except Exception as e:
             raise Exception(f"Failed to get UPS rates: {str(e)}")
     
@@ -131,31 +158,30 @@ class UPSRates:
         Returns:
             List[UPSRateResponse]: List of parsed rate options
         """
-        rate_options = []
+        return [
+            self._build_option(shipment)
+            for shipment in data.get("RateResponse", {}).get("RatedShipment", ())
+        ]
+    
+    def _build_option(self, shipment: Dict) -> UPSRateResponse:
+        """
+        Build a rate option from a single RatedShipment entry.
         
-        for service in data.get("RateResponse", {}).get("RatedShipment", []):
-            service_name = service.get("Service", {}).get("Description", "")
-            service_code = service.get("Service", {}).get("Code", "")
-            
-            # Get the total cost
-            total_cost = float(service.get("TotalCharges", {}).get("MonetaryValue", 0))
-            
-            # Get estimated transit time
-            transit_time = service.get("GuaranteedDelivery", {}).get("BusinessDaysInTransit", "")
-            estimated_days = self._parse_transit_time(transit_time)
-            
-            # Get delivery date
-            delivery_date = service.get("GuaranteedDelivery", {}).get("DeliveryByTime", "")
+        Args:
+            shipment (Dict): A RatedShipment entry
             
-            rate_options.append(UPSRateResponse(
-                service_name=service_name,
-                service_code=service_code,
-                cost=total_cost,
-                estimated_days=estimated_days,
-                delivery_date=delivery_date
-            ))
-        
-        return rate_options
+        Returns:
+            UPSRateResponse: The parsed rate option
+        """
+        service = shipment.get("Service") or {}
+        guaranteed = shipment.get("GuaranteedDelivery") or {}
+        return UPSRateResponse(
+            service_name=service.get("Description", ""),
+            service_code=service.get("Code", ""),
+            cost=float((shipment.get("TotalCharges") or {}).get("MonetaryValue", 0)),
+            estimated_days=self._parse_transit_time(guaranteed.get("BusinessDaysInTransit", "")),
+            delivery_date=guaranteed.get("DeliveryByTime", "")
+        )
     
     def _parse_transit_time(self, transit_time: str) -> int:
         """
@@ -167,7 +193,10 @@ class UPSRates:
         Returns:
             int: Estimated days for delivery
         """
-        try:
+        # Checked up front: most quotes lack a guaranteed transit time, and
+        # raising ValueError for each of them is the slow path
+        if isinstance(transit_time, str) and transit_time.isdecimal():
             return int(transit_time)
-        except (ValueError, TypeError):
-            return 5  # Default to 5 days if unknown
+        if isinstance(transit_time, int):
+            return transit_time
+        return 5  # Default to 5 days if unknown
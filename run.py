@@ -13,11 +13,17 @@ load_dotenv()
 
 if __name__ == "__main__":
     port = int(os.getenv("PORT", "10000"))  # Use Render's PORT env var or default to 10000
+    # The file watcher is a development convenience; keep it off in production
+    reload = os.getenv("UVICORN_RELOAD", "false").lower() == "true"
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=port,
-        reload=True,
+        reload=reload,
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+        # libuv event loop and C HTTP parser; uvloop does not support Windows
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
         log_level="info"
     )
 # Load environment variables
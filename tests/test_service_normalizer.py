@@ -0,0 +1,35 @@
+"""Tests for the service normalizer's mapping file handling."""
+
+from rates.service_normalizer import ServiceNormalizer
+
+def _write_csv(path, content):
+    path.write_text(content, newline='')
+    return path
+
+def test_add_mapping_without_trailing_newline(tmp_path):
+    """A row added to a file missing its final newline starts on its own line."""
+    mapping_file = _write_csv(
+        tmp_path / "services.csv",
+        "carrier,service_name,normalized_service\nfedex,FedEx Ground,Ground"
+    )
+    
+    ServiceNormalizer(str(mapping_file)).add_mapping("ups", "UPS Ground", "Ground")
+    
+    reloaded = ServiceNormalizer(str(mapping_file))
+    assert reloaded.normalize_service("fedex", "FedEx Ground") == "Ground"
+    assert reloaded.normalize_service("ups", "UPS Ground") == "Ground"
+
+def test_add_mapping_with_trailing_newline(tmp_path):
+    """No blank row is inserted when the file already ends with a newline."""
+    mapping_file = _write_csv(
+        tmp_path / "services.csv",
+        "carrier,service_name,normalized_service\nfedex,FedEx Ground,Ground\n"
+    )
+    
+    ServiceNormalizer(str(mapping_file)).add_mapping("ups", "UPS Ground", "Ground")
+    
+    assert mapping_file.read_text() == (
+        "carrier,service_name,normalized_service\n"
+        "fedex,FedEx Ground,Ground\n"
+        "ups,ups ground,Ground\n"
+    )
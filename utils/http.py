@@ -0,0 +1,49 @@
+"""Shared HTTP client session for carrier API calls."""
+
+from typing import Any, Optional
+import aiohttp
+import orjson
+
+# Carrier traffic goes to a handful of hosts, so cap per host rather than
+# relying on the global limit alone
+POOL_LIMIT = 100
+POOL_LIMIT_PER_HOST = 32
+DNS_CACHE_TTL_SECONDS = 600
+
+_session: Optional[aiohttp.ClientSession] = None
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize a request body for aiohttp, which expects str."""
+    return orjson.dumps(obj).decode()
+
+async def get_session() -> aiohttp.ClientSession:
+    """
+    Get the process-wide aiohttp session, creating it on first use.
+
+    Reusing one session keeps connections, TLS sessions and DNS lookups
+    alive across carrier requests instead of paying for them on every call.
+
+    Returns:
+        aiohttp.ClientSession: The shared session
+    """
+    global _session
+    # No await between the check and the assignment, so concurrent callers
+    # on the event loop cannot create two sessions
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=POOL_LIMIT,
+                limit_per_host=POOL_LIMIT_PER_HOST,
+                ttl_dns_cache=DNS_CACHE_TTL_SECONDS,
+                keepalive_timeout=75
+            ),
+            json_serialize=_json_dumps
+        )
+    return _session
+
+async def close_session() -> None:
+    """Close the shared session, if one was created."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
@@ -1,12 +1,100 @@
 # Log
 # TODO: Implement this module
 
+import atexit
 import logging
-import json
-from datetime import datetime
-from typing import Dict, Any, Optional
+import os
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 
+import orjson
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize a structured log payload."""
+    # Callers may pass non-str keys in extra; accept them as stdlib json would
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+# (epoch second, formatted second) of the last structured timestamp; replaced
+# as a whole so threads never see a mismatched pair
+_ts_cache: Tuple[int, str] = (0, "")
+
+def _utc_timestamp(created: float) -> str:
+    """
+    Format a UTC epoch time as ISO 8601 with microseconds.
+    
+    The date and time up to the second are formatted at most once per
+    second and reused for every record logged within it.
+    
+    Args:
+        created (float): Seconds since the epoch, e.g. LogRecord.created
+        
+    Returns:
+        str: The timestamp, e.g. '2024-01-01T12:00:00.123456Z'
+    """
+    global _ts_cache
+    sec = int(created)
+    cached_sec, prefix = _ts_cache
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _ts_cache = (sec, prefix)
+    return f"{prefix}.{int((created - sec) * 1e6):06d}Z"
+
+class StructuredFormatter(logging.Formatter):
+    """Formatter that renders records carrying structured data as JSON messages."""
+    
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        """
+        Format a record, replacing its message with a JSON payload if it has extra data.
+        
+        Args:
+            record (logging.LogRecord): The record being formatted
+            
+        Returns:
+            str: The formatted record
+        """
+        structured = getattr(record, 'structured_data', None)
+        if structured:
+            # Encode once per record, however many handlers format it
+            payload = getattr(record, 'structured_json', None)
+            if payload is None:
+                payload = record.structured_json = _json_dumps({
+                    "timestamp": _utc_timestamp(record.created),
+                    "message": record.message,
+                    **structured
+                })
+            record.message = payload
+        return super().formatMessage(record)
+
+# One formatter serves every handler; they all run on the listener thread
+_formatter = StructuredFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+class _RecordQueueHandler(QueueHandler):
+    """Queue handler that leaves formatting to the listener's handlers."""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Prepare a record for the queue.
+        
+        The listener runs in this process, so the record is queued as-is,
+        exc_info included; only the %-style arguments are merged here so that
+        later changes to them cannot alter the logged message.
+        
+        Args:
+            record (logging.LogRecord): The record being queued
+            
+        Returns:
+            logging.LogRecord: The record to enqueue
+        """
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+# Background listener per logger name; its handlers do the actual I/O
+_listeners: Dict[str, QueueListener] = {}
+
 class StructuredLogger:
     """Provides structured logging capabilities for ShipVox."""
     
@@ -20,28 +108,28 @@ class StructuredLogger:
         """
         self.logger = logging.getLogger(name)
         self.logger.setLevel(logging.INFO)
+        # Records are handled here only; don't walk the root logger's handlers too
+        self.logger.propagate = False
         
-        # Create formatters
-        console_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        file_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        
-        # Console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(console_formatter)
-        self.logger.addHandler(console_handler)
+        # Loggers are shared per name, so only the first instance for a name
+        # installs handlers; later ones would duplicate every line. Request
+        # code only enqueues records, and a background thread writes them.
+        self._listener = _listeners.get(name)
+        if self._listener is None:
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(_formatter)
+            
+            log_queue: queue.Queue = queue.Queue(-1)
+            self._listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
+            _listeners[name] = self._listener
+            self.logger.addHandler(_RecordQueueHandler(log_queue))
+            self._listener.start()
+            # Drains queued records before the process exits
+            atexit.register(self._listener.stop)
         
         # File handler if log file is specified
         if log_file:
-            log_path = Path(log_file)
-            log_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            file_handler = logging.FileHandler(log_file)
-            file_handler.setFormatter(file_formatter)
-            self.logger.addHandler(file_handler)
+            self.add_file_handler(log_file)
     
     def setLevel(self, level: str) -> None:
         """
@@ -60,93 +148,105 @@ class StructuredLogger:
         numeric_level = level_map.get(level.upper(), logging.INFO)
         self.logger.setLevel(numeric_level)
     
-    def _format_message(self, message: str, extra: Optional[Dict[str, Any]] = None) -> str:
+    def _log(self, level: int, message: str, args: Tuple[Any, ...],
+             extra: Optional[Dict[str, Any]] = None, **kwargs: Any) -> None:
         """
-        Format a log message with extra data.
+        Emit a log record.
+        
+        %-style arguments and extra data are attached to the record as-is.
+        The arguments are merged when the record is queued, and JSON encoding
+        happens in StructuredFormatter on the listener thread.
         
         Args:
-            message (str): The log message
+            level (int): The logging level
+            message (str): The log message, optionally with %-style placeholders
+            args (Tuple[Any, ...]): Arguments for the message placeholders
             extra (Optional[Dict[str, Any]]): Additional data to log
-            
-        Returns:
-            str: Formatted log message
         """
-        if not extra:
-            return message
-            
-        log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "message": message,
-            **extra
-        }
-        return json.dumps(log_data)
+        if not self.logger.isEnabledFor(level):
+            return
+        if extra:
+            kwargs['extra'] = {'structured_data': extra}
+        self.logger.log(level, message, *args, **kwargs)
     
-    def info(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
+    def info(self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None) -> None:
         """
         Log an info message.
         
         Args:
-            message (str): The log message
+            message (str): The log message, optionally with %-style placeholders
+            *args (Any): Arguments for the message placeholders
             extra (Optional[Dict[str, Any]]): Additional data to log
         """
-        self.logger.info(self._format_message(message, extra))
+        self._log(logging.INFO, message, args, extra)
     
-    def warning(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
+    def warning(self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None) -> None:
         """
         Log a warning message.
         
         Args:
-            message (str): The log message
+            message (str): The log message, optionally with %-style placeholders
+            *args (Any): Arguments for the message placeholders
             extra (Optional[Dict[str, Any]]): Additional data to log
         """
-        self.logger.warning(self._format_message(message, extra))
+        self._log(logging.WARNING, message, args, extra)
     
-    def error(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
+    def error(self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None) -> None:
         """
         Log an error message.
         
         Args:
-            message (str): The log message
+            message (str): The log message, optionally with %-style placeholders
+            *args (Any): Arguments for the message placeholders
             extra (Optional[Dict[str, Any]]): Additional data to log
         """
-        self.logger.error(self._format_message(message, extra))
+        self._log(logging.ERROR, message, args, extra)
     
-    def debug(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
+    def debug(self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None) -> None:
         """
         Log a debug message.
         
         Args:
-            message (str): The log message
+            message (str): The log message, optionally with %-style placeholders
+            *args (Any): Arguments for the message placeholders
             extra (Optional[Dict[str, Any]]): Additional data to log
         """
-        self.logger.debug(self._format_message(message, extra))
+        self._log(logging.DEBUG, message, args, extra)
     
-    def exception(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
+    def exception(self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None) -> None:
         """
         Log an exception message.
         
         Args:
-            message (str): The log message
+            message (str): The log message, optionally with %-style placeholders
+            *args (Any): Arguments for the message placeholders
             extra (Optional[Dict[str, Any]]): Additional data to log
         """
-        self.logger.exception(self._format_message(message, extra))
+        self._log(logging.ERROR, message, args, extra, exc_info=True)
 
     def add_file_handler(self, log_file: str) -> None:
         """
-        Add a file handler to the logger.
+        Add a file handler to the logger, unless one already writes to the file.
+        
+        Records reach it through the logger's background queue listener.
         
         Args:
             log_file (str): Path to the log file
         """
+        # FileHandler stores the absolute path; skip files already handled
+        file_path = os.path.abspath(log_file)
+        for handler in self._listener.handlers:
+            if isinstance(handler, logging.FileHandler) and handler.baseFilename == file_path:
+                return
+        
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
-        file_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
         file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(file_formatter)
-        self.logger.addHandler(file_handler)
+        file_handler.setFormatter(_formatter)
+        # The listener reads its handlers per record, so swapping the tuple
+        # takes effect without restarting it
+        self._listener.handlers += (file_handler,)
 
 # Create a default logger instance
 logger = StructuredLogger()
@@ -5,10 +5,66 @@ import re
 from typing import Dict, Any, Optional
 from utils.exceptions import ValidationError
 
+# Sentinel for fields that are absent from the validated object
+_MISSING = object()
+
+def _fast_valid_zip(zip_code: str) -> bool:
+    """
+    Check a ZIP or ZIP+4 code without running the regex engine.
+    
+    Args:
+        zip_code (str): The ZIP code to check
+        
+    Returns:
+        bool: True if the value is 5 digits, optionally followed by '-' and 4 digits
+    """
+    if not isinstance(zip_code, str) or not zip_code.isascii():
+        return False
+    length = len(zip_code)
+    if length == 5:
+        return zip_code.isdigit()
+    return (
+        length == 10 and zip_code[5] == '-'
+        and zip_code[:5].isdigit() and zip_code[6:].isdigit()
+    )
+
 class ShippingValidator:
     """Validates shipping-related input data."""
     
-    ZIP_CODE_PATTERN = re.compile(r'^\d{5}(-\d{4})?$')
+    # Same ASCII-only format _fast_valid_zip checks, for callers that need a
+    # pattern; \Z rather than $ so a trailing newline is rejected too
+    ZIP_CODE_PATTERN = re.compile(r'^[0-9]{5}(-[0-9]{4})?\Z')
+    
+    ALLOWED_CARRIERS = frozenset({'fedex', 'ups'})
+    
+    # Required fields per validated object
+    _DIMENSION_FIELDS = ('length', 'width', 'height')
+    _ADDRESS_FIELDS = ('street1', 'city', 'state', 'zip_code')
+    _RATE_FIELDS = ('origin_zip', 'destination_zip', 'weight', 'dimensions')
+    _LABEL_FIELDS = (
+        'carrier', 'service', 'from_address', 'to_address',
+        'weight', 'dimensions'
+    )
+    _PICKUP_FIELDS = (
+        'carrier', 'pickup_address', 'contact_info',
+        'earliest_pickup', 'latest_pickup'
+    )
+    
+    @staticmethod
+    def _get_field(data: Any, field: str) -> Any:
+        """
+        Read a field from a dict or an attribute-style object (e.g. a Pydantic model).
+        
+        Args:
+            data (Any): The dict or object being validated
+            field (str): The field name
+            
+        Returns:
+            Any: The field value, or _MISSING if the field is absent
+        """
+        if isinstance(data, dict):
+            return data.get(field, _MISSING)
+        return getattr(data, field, _MISSING)
     
     @staticmethod
     def validate_zip_code(zip_code: str, field_name: str = "zip_code") -> None:
@@ -25,27 +81,25 @@ class ShippingValidator:
         if not zip_code:
             raise ValidationError(f"{field_name} is required")
             
-        if not ShippingValidator.ZIP_CODE_PATTERN.match(zip_code):
+        if not _fast_valid_zip(zip_code):
             raise ValidationError(f"Invalid {field_name} format: {zip_code}")
     
     @staticmethod
-    def validate_dimensions(dimensions: Dict[str, float]) -> None:
+    def validate_dimensions(dimensions: Any) -> None:
         """
         Validate package dimensions.
         
         Args:
-            dimensions (Dict[str, float]): Dictionary with length, width, height
+            dimensions (Any): Dictionary or model with length, width, height
             
         Raises:
             ValidationError: If dimensions are invalid
         """
-        required_fields = ['length', 'width', 'height']
-        
-        for field in required_fields:
-            if field not in dimensions:
+        for field in ShippingValidator._DIMENSION_FIELDS:
+            value = ShippingValidator._get_field(dimensions, field)
+            if value is _MISSING:
                 raise ValidationError(f"Missing dimension: {field}")
                 
-            value = dimensions[field]
             if not isinstance(value, (int, float)):
                 raise ValidationError(f"{field} must be a number")
                 
@@ -70,48 +124,51 @@ class ShippingValidator:
             raise ValidationError("Weight must be positive")
     
     @staticmethod
-    def validate_address(address: Dict[str, Any]) -> None:
+    def validate_address(address: Any) -> None:
         """
         Validate shipping address.
         
         Args:
-            address (Dict[str, Any]): Address information
+            address (Any): Address information as a dict or model
             
         Raises:
             ValidationError: If address is invalid
         """
-        required_fields = ['street1', 'city', 'state', 'zip_code']
-        
-        for field in required_fields:
-            if field not in address:
+        for field in ShippingValidator._ADDRESS_FIELDS:
+            value = ShippingValidator._get_field(address, field)
+            if value is _MISSING:
                 raise ValidationError(f"Missing address field: {field}")
                 
-            if not address[field]:
+            if not value:
                 raise ValidationError(f"Empty address field: {field}")
         
-        ShippingValidator.validate_zip_code(address['zip_code'], 'zip_code')
+        ShippingValidator.validate_zip_code(
+            ShippingValidator._get_field(address, 'zip_code'), 'zip_code'
+        )
     
     @staticmethod
-    def validate_rate_request(request: Dict[str, Any]) -> None:
+    def validate_rate_request(request: Any) -> None:
         """
         Validate a rate request.
         
         Args:
-            request (Dict[str, Any]): Rate request data
+            request (Any): Rate request data as a dict or model
             
         Raises:
             ValidationError: If request is invalid
         """
-        required_fields = ['origin_zip', 'destination_zip', 'weight', 'dimensions']
+        values = {}
         
-        for field in required_fields:
-            if field not in request:
+        for field in ShippingValidator._RATE_FIELDS:
+            value = ShippingValidator._get_field(request, field)
+            if value is _MISSING:
                 raise ValidationError(f"Missing required field: {field}")
+            values[field] = value
         
-        ShippingValidator.validate_zip_code(request['origin_zip'], 'origin_zip')
-        ShippingValidator.validate_zip_code(request['destination_zip'], 'destination_zip')
-        ShippingValidator.validate_weight(request['weight'])
-        ShippingValidator.validate_dimensions(request['dimensions'])
+        ShippingValidator.validate_zip_code(values['origin_zip'], 'origin_zip')
+        ShippingValidator.validate_zip_code(values['destination_zip'], 'destination_zip')
+        ShippingValidator.validate_weight(values['weight'])
+        ShippingValidator.validate_dimensions(values['dimensions'])
     
     @staticmethod
     def validate_label_request(request: Dict[str, Any]) -> None:
@@ -124,16 +181,11 @@ class ShippingValidator:
         Raises:
             ValidationError: If request is invalid
         """
-        required_fields = [
-            'carrier', 'service', 'from_address', 'to_address',
-            'weight', 'dimensions'
-        ]
-        
-        for field in required_fields:
+        for field in ShippingValidator._LABEL_FIELDS:
             if field not in request:
                 raise ValidationError(f"Missing required field: {field}")
         
-        if request['carrier'] not in ['fedex', 'ups']:
+        if request['carrier'] not in ShippingValidator.ALLOWED_CARRIERS:
             raise ValidationError(f"Invalid carrier: {request['carrier']}")
         
         ShippingValidator.validate_address(request['from_address'])
@@ -152,16 +204,11 @@ class ShippingValidator:
         Raises:
             ValidationError: If request is invalid
         """
-        required_fields = [
-            'carrier', 'pickup_address', 'contact_info',
-            'earliest_pickup', 'latest_pickup'
-        ]
-        
-        for field in required_fields:
+        for field in ShippingValidator._PICKUP_FIELDS:
             if field not in request:
                 raise ValidationError(f"Missing required field: {field}")
         
-        if request['carrier'] not in ['fedex', 'ups']:
+        if request['carrier'] not in ShippingValidator.ALLOWED_CARRIERS:
             raise ValidationError(f"Invalid carrier: {request['carrier']}")
         
         ShippingValidator.validate_address(request['pickup_address'])